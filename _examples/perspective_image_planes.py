@@ -36,24 +36,80 @@ import rig.nodes     as rn
 import rig.functions as rf
 import rig
 
-from rig.attributes import Int, Float, String, Enum, lock, hide
+from rig.attributes import lock
 from rig import Node, List, container, condition
-from rig import trigonometry as trig
 
 from collections import namedtuple
+from contextlib import contextmanager
+
+
+# user attributes added to every image plane shape, in creation order
+SHAPE_ATTRIBUTES = (('image',          {'dataType': 'string'}),
+                    ('sequenceType',   {'attributeType': 'enum', 
+                                        'enumName': 'Static:Sequence:Looping:Ping Pong:'}),
+                    ('sequenceStart',  {'attributeType': 'long',   'minValue': 0}),
+                    ('sequenceEnd',    {'attributeType': 'long',   'minValue': 0, 'defaultValue': 100}),
+                    ('sequenceOffset', {'attributeType': 'long'}),
+                    ('alpha',          {'attributeType': 'double', 'minValue': 0, 'maxValue': 1, 'defaultValue': 0}),
+                    ('opacity',        {'attributeType': 'double', 'minValue': 0, 'maxValue': 1, 'defaultValue': 1}))
+
+
+@contextmanager
+def undo_chunk(name):
+    """
+    Records every command issued within the scope as a single undo entry
+    """
+    mc.undoInfo(openChunk=True, chunkName=name)
+    try:
+        yield
+    finally:
+        mc.undoInfo(closeChunk=True)
+
 
 
 def get_scale(aperture, focal_length, distance):
     """
     Computes the scale of an image plane relative to the camera
+    (focal_length is expected in inches)
+    """
+    # 2 * tan(atan(aperture / (2 * focal_length))) reduces to
+    # aperture / focal_length, no need for a trig network
+    return distance * aperture / focal_length
+
+
+
+def build_sequence(frame, shape):
+    """
+    Computes the frame extension of an image sequence from the
+    shape's sequence attributes (static, looping or ping pong)
     """
-    focal_length = focal_length * 0.0393700787 # conv mm to inches
-    aov = trig.atan(aperture/(2*focal_length)) # angle of view
+    current  = frame - shape.sequenceStart + shape.sequenceOffset
+    duration = shape.sequenceEnd - shape.sequenceStart
+    static   = rf.clamp(current, shape.sequenceStart, shape.sequenceEnd)
+    looping  = current % (duration+1)
+    
+    # ping pong!
+    length   = 2*duration
+    state    = rf.abs(current-shape.sequenceStart) % length
+    pingpong = condition(state > duration, length-state, state+shape.sequenceStart)
+    
+    return rf.choice([0, static, looping, pingpong], selector=shape.sequenceType)
 
-    x = trig.sin(aov)
-    y = (1-(x**2))**0.5
 
-    return x*2 * distance/y
+
+def tree_max(tokens):
+    """
+    Returns the highest value of the inputs by pairing them in a balanced
+    tree, keeping the network depth to log2(n) instead of n.
+    """
+    tokens = list(tokens)
+    while len(tokens) > 1:
+        paired = [rf.max([tokens[i], tokens[i+1]]) for i in range(0, len(tokens)-1, 2)]
+        if len(tokens) % 2:
+            paired.append(tokens[-1])
+        tokens = paired
+
+    return tokens[0]
 
 
 
@@ -87,11 +143,17 @@ def create_setup(camera,                    # name of the camera to create
     horizonal_list = List()
     vertical_list  = List()
     
-    with container('{}_container'.format(name.lower())) as node_container:
+    with undo_chunk(name), container('{}_container'.format(name.lower())) as node_container:
         
         # add the camera shape 
         node_container.add(camera_shape)
         
+        # focal length is shared by all planes, convert mm to inches once
+        focal_length = camera_shape.fl * 0.0393700787
+        
+        # all planes are driven by the same timeline
+        frame = rf.frame()
+        
         for i in range(count):
             
             # append a number to the end of the name
@@ -106,28 +168,14 @@ def create_setup(camera,                    # name of the camera to create
                                             container=False)
     
             
-            # add plane constructor to container and
-            # parent the transform to something useful
+            # add plane constructor to container
             container.add(plane)
-            
-            if parent:
-                mc.parent(transform, parent)
-            else:
-                mc.parent(transform, camera)
                 
                 
             # offset the plane
             transform.tz << (i+1) * -offset
             
             
-            # lock and hide transform channels
-            transform.tx << lock << hide
-            transform.ty << lock << hide        
-            transform.s  << lock << hide
-            transform.r  << lock << hide
-            transform.v  << lock << hide 
-            
-            
             # create a shading network for the poly plane
             material_name = name_suffix.lower()
             material = rc.shadingNode('lambert', 
@@ -146,7 +194,7 @@ def create_setup(camera,                    # name of the camera to create
             
             # assign shader to plane
             Node('defaultShaderList1.s') << material.msg # hypershade backwards compatibility
-            shape = rc.listRelatives(transform, type='mesh')[0]
+            shape = rc.listRelatives(transform, shapes=True, type='mesh')[0]
             rc.sets(shape, e=True, forceElement=shading_engine)
             
             
@@ -156,37 +204,23 @@ def create_setup(camera,                    # name of the camera to create
             material.ambientColor << texture.outColor
             material.diffuse      << 1
 
-            shape << String('image') << default
-            shape << Enum('sequenceType', en='Static:Sequence:Looping:Ping Pong')
-
-            shape << Int('sequenceStart', min=0)
-            shape << Int('sequenceEnd'  , min=0, dv=100)
-            shape << Int('sequenceOffset')
+            # add the image and sequence attributes in one pass
+            for attr_name, flags in SHAPE_ATTRIBUTES:
+                mc.addAttr(str(shape), longName=attr_name, keyable=True, **flags)
             
-            
-            # setup the animated background
-            current  = rf.frame() - shape.sequenceStart + shape.sequenceOffset
-            duration = shape.sequenceEnd - shape.sequenceStart
-            static   = rf.clamp(current, shape.sequenceStart, shape.sequenceEnd)
-            looping  = current % (duration+1)
-            
-            # ping pong!
-            length   = 2*duration
-            state    = rf.abs(current-shape.sequenceStart) % length
-            pingpong = condition(state > duration, length-state, state+shape.sequenceStart)
+            shape.image << default
             
             
+            # setup the animated background
             texture.fileTextureName   << shape.image
             texture.useFrameExtension << (shape.sequenceType > 0)
             texture.frameOffset       << lock # don't use this!
             #texture.frameExtension    << condition(shape.sequenceType==2, looping, static)
-            texture.frameExtension    << rf.choice([0, static, looping, pingpong], selector=shape.sequenceType)
+            texture.frameExtension    << build_sequence(frame, shape)
             
             # remap transparency
             remap = rn.colorCorrect()
             remap.inColor         << texture.outTransparency
-            shape                 << Float('alpha',    dv=0, min=0, max=1)
-            shape                 << Float('opacity',  dv=1, min=0, max=1)
             remap.colGain         << rf.rev(rf.rev(shape.alpha) * shape.opacity)
             remap.colOffset       << rf.rev(shape.opacity)
             material.transparency << remap.outColor
@@ -199,33 +233,40 @@ def create_setup(camera,                    # name of the camera to create
             # - camera's aperture (if not ortho)
             # - image's size
             
-            # make a proxy texture file node to retrieve image size
-            texture_ = rn.file()
-            texture_.fileTextureName << shape.image            
+            # planes parented to the camera are as far as their depth,
+            # tz stays unlocked so read it live
+            if parent:
+                distance = rf.dist(transform.wm, camera.wm)
+            else:
+                distance = -transform.tz
             
             # if texture is not set, set image aspect ratio to 1
-            distance   = rf.dist(transform.wm, camera.wm)
-            width      = condition(texture_.outSizeX > 0, texture_.outSizeX, 1)
-            height     = condition(texture_.outSizeY > 0, texture_.outSizeY, 1)
-            horizontal = condition(height > width,  width/height, 1)
-            vertical   = condition(width  > height, height/width, 1)
+            width      = rf.max([texture.outSizeX, 1])
+            height     = rf.max([texture.outSizeY, 1])
+            horizontal = rf.min([width/height, 1])
+            vertical   = rf.min([height/width, 1])
         
-            X = get_scale(horizontal, camera_shape.fl, distance)
-            Y = get_scale(vertical,   camera_shape.fl, distance)
+            X = get_scale(horizontal, focal_length, distance)
+            Y = get_scale(vertical,   focal_length, distance)
         
-            X  = condition(camera_shape.orthographic, (X/Y) * camera_shape.ow, X)
-            Y  = condition(camera_shape.orthographic, camera_shape.ow, Y)
+            # the aspect ratio is the same for perspective and orthographic
+            ratio     = X/Y
+            ratio_inv = Y/X
             
-            X_ = condition(camera_shape.orthographic, camera_shape.ow, X)
-            Y_ = condition(camera_shape.orthographic, (Y/X) * camera_shape.ow, Y)    
+            # switch to the ortho width when the camera is orthographic
+            ortho = camera_shape.orthographic
+            X_ = rf.choice([X, camera_shape.ow], selector=ortho)
+            Y_ = rf.choice([Y, ratio_inv * camera_shape.ow], selector=ortho)
+            X  = rf.choice([X, ratio * camera_shape.ow], selector=ortho)
+            Y  = rf.choice([Y, camera_shape.ow], selector=ortho)
 
             plane.width  << condition(X<Y, X, X_)
             plane.height << condition(X<Y, Y, Y_)
         
         
             # build list of values to be plugged in the camera's aspect ratio
-            h = condition(vertical < horizontal, 1, X/Y)
-            v = condition(horizontal < vertical, 1, Y/X)        
+            h = condition(vertical < horizontal, 1, ratio)
+            v = condition(horizontal < vertical, 1, ratio_inv)        
             
             horizonal_list.append(h)
             vertical_list.append(v)
@@ -235,12 +276,28 @@ def create_setup(camera,                    # name of the camera to create
             output.planes.append(transform)
             output.shapes.append(shape)
     
+    
+        # parent all the transforms to something useful in one go,
+        # keeping their local offsets relative to the new parent
+        mc.parent([str(x) for x in output.planes], 
+                  str(parent) if parent else str(camera), 
+                  relative=True)
+        
+        
+        # lock and hide transform channels in a single sweep
+        channels = ('tx', 'ty', 's', 'sx', 'sy', 'sz', 'r', 'rx', 'ry', 'rz', 'v')
+        for transform in output.planes:
+            for attr in channels:
+                mc.setAttr('{}.{}'.format(str(transform), attr), 
+                           lock=True, 
+                           keyable=False, 
+                           channelBox=False)
         
     
         # plug the system back into the camera's aspect ratio
         if count > 1:  
-            camera_shape.hfa << rf.max(horizonal_list)
-            camera_shape.vfa << rf.max(vertical_list)
+            camera_shape.hfa << tree_max(horizonal_list)
+            camera_shape.vfa << tree_max(vertical_list)
         else:
             camera_shape.hfa << horizonal_list
             camera_shape.vfa << vertical_list        
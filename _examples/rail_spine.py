@@ -31,11 +31,17 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
 import maya.cmds     as mc
+import maya.api.OpenMaya as om
 import rig.commands  as rc
 import rig.nodes     as rn
 import rig.functions as rf
+import numpy as np
 import numbers
 
+from functools import lru_cache
+from contextlib import contextmanager
+from collections import deque
+
 from rig.attributes import Float, Enum, lock, hide
 from rig import Node, List, container, condition, options
 from rig import matrix
@@ -44,6 +50,52 @@ from rig import constant
 from rig._language import _is_sequence
 
 
+# unit vectors picked by the rail's axis enums (X:Y:Z)
+AXIS_BASIS = ((1,0,0), (0,1,0), (0,0,1))
+
+# rail attributes driving the orientation of every motionPath on the rail
+RAIL_AXIS_PLUGS = (('aimAxis',   'frontAxis'),
+                   ('upAxis',    'upAxis'),
+                   ('invertAim', 'inverseFront'),
+                   ('invertUp',  'inverseUp'))
+
+
+
+def axis_choice(selector):
+    """
+    Returns the unit vector of the axis enum given as selector
+    """
+    return rf.choice(AXIS_BASIS, selector=selector)
+
+
+
+@contextmanager
+def suspend_evaluation():
+    """
+    Switches the evaluation manager to DG mode while building so the scene
+    is not re-evaluated for every connection made within the scope
+    """
+    mode = mc.evaluationManager(query=True, mode=True)[0]
+    mc.evaluationManager(mode='off')
+    try:
+        yield
+    finally:
+        mc.evaluationManager(mode=mode)
+
+
+
+@lru_cache(maxsize=128)
+def _open_knots(degree, count):
+    """ open knot vector, cached since rigs reuse the same degrees and counts """
+    return tuple(np.clip(np.arange(count+degree-1) - (degree-1), 0, count-degree).tolist())
+
+
+@lru_cache(maxsize=128)
+def _periodic_knots(degree, count):
+    """ closed knot vector, cached since rigs reuse the same degrees and counts """
+    return tuple(range(1-degree, count+degree))
+
+
 
 def make_curve(cv, degree=3, periodic=False, name='railCurve1', k=None):
     """
@@ -56,7 +108,7 @@ def make_curve(cv, degree=3, periodic=False, name='railCurve1', k=None):
 
         # compute closed knot vector
         if not k:
-            k = list(range(0-degree+1,count+degree))
+            k = list(_periodic_knots(degree, count))
 
         # make the curve
         curve = rc.curve(per=periodic, d=degree, p=cv+cv[:degree], k=k)
@@ -65,7 +117,7 @@ def make_curve(cv, degree=3, periodic=False, name='railCurve1', k=None):
     # compute open knot vector
     else:
         if not k:
-            k = [min(max(0,x-degree+1), count-degree) for x in range(count+degree-1)]  
+            k = list(_open_knots(degree, count))
 
         # make the curve 
         curve = rc.curve(per=periodic, d=degree, p=cv, k=k)
@@ -82,6 +134,23 @@ def make_curve(cv, degree=3, periodic=False, name='railCurve1', k=None):
 
 
 
+def make_motion_path(rail, rail_shape):
+    """
+    Creates a motionPath on the rail with the wiring shared by every rider
+    """
+    path = rn.motionPath()
+    path.fractionMode  << 1 # turn on percentage mode
+    path.geometryPath  << rail_shape.worldSpace[0]
+
+    # the path is brand new, plain enum to enum connections are enough
+    for src, dst in RAIL_AXIS_PLUGS:
+        mc.connectAttr('{}.{}'.format(str(rail), src), 
+                       '{}.{}'.format(str(path), dst))
+    
+    return path
+
+
+
 def create_rail(position_controls,
                 u,
                 orient_controls=None,
@@ -111,10 +180,12 @@ def create_rail(position_controls,
             # if more then 1 control, make sure they're all position_controls
             # and and then sequentially order them to match the position_controls order
             if len(controls) > 1:
-                if not all([str(x) in position_controls for x in controls]):
+                position_names = set(str(x) for x in position_controls)
+                control_names  = set(str(x) for x in controls)
+                if not control_names.issubset(position_names):
                     raise Exception('When more than 1, controls must be members of position_controls.')
     
-                controls = [x for x in position_controls if str(x) in list([str(y) for y in controls])]
+                controls = [x for x in position_controls if str(x) in control_names]
         
             return List(controls)
         
@@ -132,6 +203,12 @@ def create_rail(position_controls,
             
 
         position_controls = List(position_controls)
+        
+        # map each control to its index (first occurrence, like List.index)
+        control_index = {}
+        for i, x in enumerate(position_controls):
+            control_index.setdefault(str(x), i)
+            
         orient_controls   = _order_controls(orient_controls, position_controls)
         scale_controls    = _order_controls(scale_controls,  position_controls)
         
@@ -140,7 +217,7 @@ def create_rail(position_controls,
         # if u is a numeric value, it represents a count of equidistent rail riders.
         if isinstance(u, numbers.Real):
             if u > 1:
-                u = [x/(u-1.) for x in range(u)]
+                u = np.linspace(0., 1., int(u)).tolist()
     
             elif u == 1:
                 u = [0.]
@@ -159,8 +236,13 @@ def create_rail(position_controls,
                 
             
         
-        # get curve control positions
-        pos = [mc.xform(x, q=True, ws=True, t=True) for x in position_controls]
+        # get curve control positions through the API, one dag path per control
+        # taken from the control's own MFn so duplicates and non-unique names
+        # still line up with position_controls
+        pos = [list(om.MFnTransform(x.__data__.node.getPath()).translation(om.MSpace.kWorld)) 
+               for x in position_controls]
+        
+        rest_pos = np.asarray(pos, dtype=np.float64)
         
         # if periodic, roll the positions so u=0 matches first controller
         if periodic and degree > 1:
@@ -169,9 +251,7 @@ def create_rail(position_controls,
             
             # shift the verts so knots can register with the control points
             shift = {3:2, 5:3, 7:4}[degree]
-            pos_ = pos[shift:]
-            pos_ += pos[:shift]
-            pos = pos_
+            pos   = np.roll(rest_pos, -shift, axis=0).tolist()
             
             
 
@@ -204,10 +284,12 @@ def create_rail(position_controls,
         else:
             # shift the cv order so the proper control points move the proper knots
             shift = {3:1, 5:2, 7:3}[degree]
-            cvs   = list(rail_shape.cv[:])
-            cvs_  = cvs[shift:]
-            cvs_ += cvs[:shift]
-            cvs   = List(cvs_)         
+            # rotate the plugs in place, wrapping them in a new List()
+            # would resolve every cv Node a second time
+            cvs   = rail_shape.cv[:]
+            plugs = deque(cvs)
+            plugs.rotate(-shift)
+            cvs[:] = list(plugs)
             
             cvs << position_controls.wm * rail.wim
             
@@ -285,21 +367,18 @@ def create_rail(position_controls,
                 orient_controls << Enum('upAxis',  en='X:Y:Z:', dv=up_axis)
                 orient_controls << Enum('invertUp')
                 
-                orient_vectors = rf.choice([[1,0,0],
-                                            [0,1,0],
-                                            [0,0,1]], 
-                                           selector=orient_controls.upAxis)              
+                orient_vectors = axis_choice(orient_controls.upAxis)
     
                 orient_vectors = orient_vectors * condition(orient_controls.invertUp, -1, 1)
                 orient_vectors = rf.unit(matrix.multiply(orient_vectors, orient_controls.wm, local=True))
                                 
                 
                 if len(orient_controls) > 1:
-                    orient_weights = List([cumsum[position_controls.index(x)] for x in orient_controls])
+                    orient_weights = List([cumsum[control_index[str(x)]] for x in orient_controls])
                     
                     if periodic:
                         # if this is a complete loop, append beginning to end
-                        if position_controls.index(orient_controls[0]) == 0:
+                        if control_index[str(orient_controls[0])] == 0:
                             orient_weights.append(constant(1))
                             orient_vectors.append(orient_vectors[0])
                           
@@ -324,11 +403,11 @@ def create_rail(position_controls,
                 scale_vectors  = matrix.decompose(scale_controls.wm).outputScale
                 
                 if len(scale_controls) > 1:
-                    scale_weights  = List([cumsum[position_controls.index(x)] for x in scale_controls])
+                    scale_weights  = List([cumsum[control_index[str(x)]] for x in scale_controls])
 
                     if periodic:
                         # if this is a complete loop, append beginning to end
-                        if position_controls.index(scale_controls[0]) == 0:
+                        if control_index[str(scale_controls[0])] == 0:
                             scale_weights.append(constant(1))   
                             scale_vectors.append(scale_vectors[0])
                           
@@ -356,23 +435,13 @@ def create_rail(position_controls,
             rail << Float('uTangentStart', dv=0.001, min=0, max=1) << hide # reasonable near 0 value
             rail << Float('uTangentEnd',   dv=0.999, min=0, max=1) << hide # reasonable near 1 value
     
-            tangent_aim = rf.choice([[1,0,0],
-                                     [0,1,0],
-                                     [0,0,1]],
-                                    selector=rail.aimAxis)
+            tangent_aim = axis_choice(rail.aimAxis)
             
 
             # tangent0 will be located at the start of the rail
             # at a reasonable near 0 value to allow collapsed start points.
-            tangent0 = rn.motionPath()
-            tangent0.fractionMode  << 1 # turn on percentage mode
-            tangent0.uValue        << rail.uTangentStart
-            tangent0.geometryPath  << rail_shape.worldSpace[0]
-    
-            tangent0.frontAxis     << rail.aimAxis
-            tangent0.upAxis        << rail.upAxis
-            tangent0.inverseFront  << rail.invertAim
-            tangent0.inverseUp     << rail.invertUp
+            tangent0 = make_motion_path(rail, rail_shape)
+            tangent0.uValue << rail.uTangentStart
             
             edge0    = tangent0.allCoordinates
             tangent0 = rf.unit(tangent_aim * tangent0.orientMatrix) * current_length * rail.translateProjection
@@ -380,15 +449,8 @@ def create_rail(position_controls,
     
             # tangent1 will be located at the end of the rail
             # at a reasonable near 1 value to allow collapsed start points.    
-            tangent1 = rn.motionPath()
-            tangent1.fractionMode  << 1 # turn on percentage mode
-            tangent1.uValue        << rail.uTangentEnd
-            tangent1.geometryPath  << rail_shape.worldSpace[0]
-    
-            tangent1.frontAxis     << rail.aimAxis
-            tangent1.upAxis        << rail.upAxis
-            tangent1.inverseFront  << rail.invertAim
-            tangent1.inverseUp     << rail.invertUp   
+            tangent1 = make_motion_path(rail, rail_shape)
+            tangent1.uValue << rail.uTangentEnd
                   
             edge1    = tangent1.allCoordinates
             tangent1 = rf.unit(tangent_aim * tangent1.orientMatrix) * current_length * rail.translateProjection
@@ -397,7 +459,8 @@ def create_rail(position_controls,
 
         # ---- ADD RAIL RIDERS ---- #
         
-        for u_default in u:
+        def _add_rider(u_default):
+            """ builds a single rider and its network at the given u value """
             
             # create a rider
             rider = rn.joint(name=rider_name, container=False) # make a joint but not in the container
@@ -418,14 +481,7 @@ def create_rail(position_controls,
             rider << Float('uDefault') << u_default
             u_default = rider.uDefault
     
-            rider_path = rn.motionPath()
-            rider_path.fractionMode  << 1 # turn on percentage mode
-            rider_path.geometryPath  << rail_shape.worldSpace[0]
-    
-            rider_path.frontAxis     << rail.aimAxis
-            rider_path.upAxis        << rail.upAxis
-            rider_path.inverseFront  << rail.invertAim
-            rider_path.inverseUp     << rail.invertUp   
+            rider_path = make_motion_path(rail, rail_shape)
             
             
             # modulate the u translation
@@ -451,15 +507,13 @@ def create_rail(position_controls,
                     rider_matrix.inputScale << scale_vectors
                     
                 else:
-                    frozen   = condition(rail.scaleProjection==0, 
-                                         u_default,
-                                         u_translate)                    
-                    
-                    clamped  = condition(rail.scaleProjection==2,
-                                         rf.clamp(frozen,
-                                                  scale_weights[0],
-                                                  scale_weights[-1]),
-                                         frozen)     
+                    # Frozen:Infinite:Clamped
+                    clamped  = rf.choice([u_default,
+                                          u_translate,
+                                          rf.clamp(u_translate,
+                                                   scale_weights[0],
+                                                   scale_weights[-1])],
+                                         selector=rail.scaleProjection)
                                         
                     
                     rider_matrix.inputScale << interpolate.sequence(clamped, 
@@ -477,15 +531,13 @@ def create_rail(position_controls,
                     
                 else:
                     
-                    frozen   = condition(rail.rotateProjection==0, 
-                                         u_default,
-                                         u_translate)                    
-                
-                    clamped  = condition(rail.rotateProjection==2,
-                                         rf.clamp(frozen,
-                                                  orient_weights[0],
-                                                  orient_weights[-1]),
-                                         frozen)                      
+                    # Frozen:Infinite:Clamped
+                    clamped  = rf.choice([u_default,
+                                          u_translate,
+                                          rf.clamp(u_translate,
+                                                   orient_weights[0],
+                                                   orient_weights[-1])],
+                                         selector=rail.rotateProjection)
                     
 
                     rider_path.worldUpVector << interpolate.sequence(clamped, 
@@ -508,6 +560,11 @@ def create_rail(position_controls,
             rider_matrix = rider_matrix.outputMatrix * rail.wim
         
             rider << rider_matrix # plug srt+shear
+            
+            
+        with suspend_evaluation():
+            for u_default in u:
+                _add_rider(u_default)
 
 
 
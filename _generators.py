@@ -31,58 +31,29 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
 
-# ------------------------- ASYMMETRICAL GENERATORS -------------------------- #
-def _is_basestring(obj):
-    try:
-        return isinstance(obj, basestring) # python 2.7
-    except:
-        return isinstance(obj, str) # python 3
-    
-    
-def _is_sequence(obj):
-    """ tests if given input is a sequence """
-    
-    if _is_basestring(obj):
-        return False
-    
-    try:
-        len(obj)
-        if isinstance(obj, dict):
-            return False
-    except Exception:
-        return False
-    
-    return True
-
+from ._types import _is_basestring, _is_sequence
 
 
+# ------------------------- ASYMMETRICAL GENERATORS -------------------------- #
 
-def _yield(obj, index):
+def _accessor(obj):
     """
-    Yields the "index" of a list, tuple, set or dict
-    For dicts we yield the key at the given index.
+    Returns a (count, getter) pair used to index obj while generating.
     
-    Sets and Dicts are not ordered in python 2.7
-    so results are given in their hashed order.
+    Sets, dicts and other sequences are copied once so every
+    following lookup is a straight list index.
     """
-    # set
-    if isinstance(obj, (set,)):
-        for i, elem in enumerate(obj):
-            if i == index:
-                return elem    
-    
-    # list, tuple, nd.array sequence
-    elif _is_sequence(obj):#isinstance(obj, (list, tuple,)):
-        return list(obj)[index]
-    
-    # dict, operate on the keys
-    elif isinstance(obj, (dict,)):
-        for i, key in enumerate(obj):
-            if i == index:
-                return key
-            
-    # just return object as is      
-    return obj
+    # list, tuple
+    if isinstance(obj, (list, tuple)):
+        return len(obj), obj.__getitem__
+    
+    # set, dict keys and any other sequence (List, nd.array, etc...)
+    elif isinstance(obj, (set, dict)) or _is_sequence(obj):
+        items = list(obj)
+        return len(items), items.__getitem__
+    
+    # just repeat the object as is
+    return 1, lambda index: obj
     
 
 
@@ -101,21 +72,19 @@ def sequences(*args):
     # [5, 'hey', 'cool', ['heck yeah!']]
 
     """
-    # count size of each sublist
-    counts = [len(x) if (isinstance(x, (set, tuple, list, dict)) or _is_sequence(x)) else 1 for x in args]
-
+    # count size of each sublist and how to index it
+    accessors = [_accessor(x) for x in args]
+    
     # get the max sublist size, this will determine
     # capping index per sublist to yield
-    max_size = max(counts)
+    max_size = max(c for c, _ in accessors)
+    
+    # precompute the last index of each sublist
+    accessors = [(c-1, getter) for c, getter in accessors]
 
     # for each sublist, yield an element capped at the highest count
     for i in range(max_size):
-        result = []
-        for j, c in enumerate(counts):
-            index = min(i, c-1)
-            result.append( _yield(args[j], index) )
-
-        yield result
+        yield [getter(min(i, last)) for last, getter in accessors]
 
         
   
@@ -138,21 +107,19 @@ def dictionaries(**kargs):
     keys = list(kargs.keys())
     vals = list(kargs.values())
 
-    # count size of each sublist
-    counts = [len(x) if isinstance(x, (set, tuple, list, dict)) else 1 for x in vals]
+    # count size of each sublist and how to index it
+    accessors = [_accessor(x) for x in vals]
        
     # get the max sublist size, this will determine
     # capping index per sublist to yield
-    max_size = max(counts)
+    max_size = max(c for c, _ in accessors)
+    
+    # precompute the last index of each sublist
+    accessors = [(key, c-1, getter) for key, (c, getter) in zip(keys, accessors)]
             
     # for each sublist, yield an element capped at the highest count
     for i in range(max_size):
-        result = {}
-        for j, c in enumerate(counts):
-            index = min(i, c-1)
-            result[keys[j]] = _yield(vals[j], index)
-
-        yield result
+        yield {key: getter(min(i, last)) for key, last, getter in accessors}
     
     
 def arguments(*args, **kargs):
@@ -166,30 +133,25 @@ def arguments(*args, **kargs):
     so results may get weird.
     """
     keys = None
-    vals = None
-    counts    = []
-    kw_counts = []
-    max_count = 0
+    accessors    = []
+    kw_accessors = []
+    max_count    = 0
     
     if args:
-        counts = [len(x) if (_is_sequence(x) or isinstance(x, (set, tuple, list, dict))) else 1 for x in args]
-        max_count = max(counts)
+        accessors = [_accessor(x) for x in args]
+        max_count = max(c for c, _ in accessors)
     
     if kargs:
         keys = list(kargs.keys())
-        vals = list(kargs.values())
-        kw_counts = [len(x) if (_is_sequence(x) or isinstance(x, (set, tuple, list, dict))) else 1 for x in vals]
-        max_count = max(kw_counts+[max_count])
+        kw_accessors = [_accessor(x) for x in kargs.values()]
+        max_count = max([c for c, _ in kw_accessors] + [max_count])
         
-    for i in range(max_count):
-        result = []
-        for j, c in enumerate(counts):
-            index = min(i, c-1)
-            result.append( _yield(args[j], index) )
+    # precompute the last index of each sublist
+    accessors    = [(c-1, getter) for c, getter in accessors]
+    kw_accessors = [(key, c-1, getter) for key, (c, getter) in zip(keys or [], kw_accessors)]
         
-        kw_result = {}
-        for j, c in enumerate(kw_counts):
-            index = min(i, c-1)
-            kw_result[keys[j]] = _yield(vals[j], index)
+    for i in range(max_count):
+        result    = [getter(min(i, last)) for last, getter in accessors]
+        kw_result = {key: getter(min(i, last)) for key, last, getter in kw_accessors}
             
         yield result, kw_result
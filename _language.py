@@ -33,13 +33,20 @@ import maya.mel as mel
 import maya.cmds as mc
 import maya.api.OpenMaya as om
 import re
+import sys
 import pickle
+import threading
+import operator
 import numbers
 import codecs
 
 from functools import wraps
+from collections import OrderedDict
+from itertools import islice
 
 from ._generators import sequences, arguments
+from ._types import _is_basestring, _is_sequence, _is_list, _is_node, _is_attribute
+from ._types import _OTHER, _LIST, _NODE, _ATTRIBUTE, _SCALAR, _STRING, _SEQUENCE, _MATRIX
 from .attributes import _clone_attribute, String, lock
 
 MAYA_VERSION = int(mc.about(version=True))
@@ -51,6 +58,9 @@ USE_SHORTHAND    = True
 SKIP_SELECTION   = True
 PUBLISH_PLUGS    = True
 
+# Memoize Options
+MEMOIZE_CACHE_SIZE = 4096 # results kept per memoized function
+
 
 
 class DebugPrint():
@@ -69,13 +79,124 @@ class DebugPrint():
 
 # -------------------------- MEMOIZATION FUNCTIONS --------------------------- #
 
+# scene lookups made while building, cleared whenever a scene is new'd or opened
+_name_uuid_cache   = {} # node name --> (MObjectHandle, uuid)
+_uuid_exists_cache = {} # uuid --> MObjectHandle
+_plug_type_cache   = {} # (attribute hash, query) --> (MObjectHandle, result)
+_resolve_cache     = OrderedDict() # plug token --> (MObjectHandle, resolved token, is_point)
+_node_fn_cache     = {} # node name --> (MObjectHandle, MFn, is_transform, is_choice)
+
+
+def _clear_scene_caches(*args):
+    """ scene lookups are only valid for the scene they were made in """
+    _name_uuid_cache.clear()
+    _uuid_exists_cache.clear()
+    _plug_type_cache.clear()
+    _resolve_cache.clear()
+    _node_fn_cache.clear()
+    container.decomposed.clear()
+
+
+_SCENE_CALLBACKS = [om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew,  _clear_scene_caches),
+                    om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, _clear_scene_caches)]
+
+
+def _handle_is_named(handle, name):
+    """ True if the handle still points to a live node called name """
+    if not handle.isValid():
+        return False
+
+    obj = handle.object()
+    if '|' in name and obj.hasFn(om.MFn.kDagNode):
+        fn = om.MFnDagNode(obj)
+        return name in (fn.fullPathName(), fn.partialPathName())
+
+    return om.MFnDependencyNode(obj).name() == name
+
+
+# function sets that get an MFnDagNode, most common first
+_DAG_FN_TYPES = (om.MFn.kTransform, om.MFn.kShape, om.MFn.kPluginLocatorNode, om.MFn.kWorld)
+
+# node type name --> (is_transform, is_choice), a type's inheritance never changes
+_node_kind_cache = {}
+
+def _node_fn(name):
+    """ returns (MFn, is_transform, is_choice) of a node, cached until the node is renamed or deleted """
+    cached = _node_fn_cache.get(name)
+    if cached and _handle_is_named(cached[0], name):
+        return cached[1:]
+    
+    # store the proper function to track the node's name
+    obj = om.MGlobal.getSelectionListByName(name).getDependNode(0)
+    if any(obj.hasFn(x) for x in _DAG_FN_TYPES):
+        fn = om.MFnDagNode(obj)
+    else:
+        fn = om.MFnDependencyNode(obj)
+        
+    # only ask for the inheritance once per node type
+    kinds = _node_kind_cache.get(fn.typeName)
+    if kinds is None:
+        inherited = mc.nodeType(name, inherited=True)
+        kinds     = _node_kind_cache[fn.typeName] = ('transform' in inherited, 'choice' in inherited)
+        
+    result = (fn,) + kinds
+    
+    _node_fn_cache[name] = (om.MObjectHandle(obj),) + result
+    return result
+
+
+def _name_to_uuid(name):
+    """ returns the uuid of a node, cached until the node is renamed or deleted """
+    cached = _name_uuid_cache.get(name)
+    if cached and _handle_is_named(cached[0], name):
+        return cached[1]
+
+    obj    = om.MGlobal.getSelectionListByName(name).getDependNode(0)
+    handle = om.MObjectHandle(obj)
+    uuid   = om.MFnDependencyNode(obj).uuid().asString()
+
+    _name_uuid_cache[name]   = (handle, uuid)
+    _uuid_exists_cache[uuid] = handle
+    return uuid
+
+
+def _uuids_exist(uuids):
+    """ True if every uuid is still in the scene, only unknown uuids hit mc.ls """
+    unknown = []
+    for uuid in uuids:
+        handle = _uuid_exists_cache.get(uuid)
+        if handle is None:
+            unknown.append(uuid)
+            
+        elif not handle.isValid():
+            return False # known node was deleted, no need to look further
+
+    if unknown:
+        existing = mc.ls(unknown)
+        return existing is not None and len(existing) == len(unknown)
+
+    return True
+
+
+def _node_uuid(node, attribute=None):
+    """ returns a Node's uuid (and attribute) straight from its MFn """
+    uuid = node.__data__.node.uuid().asString()
+    if attribute:
+        return f'{uuid}.{attribute}'
+    return uuid
+
+
 def _name_to_pickle(node_attr):
     """ used to create a unique memo key """
     if isinstance(node_attr, (list, set, tuple)):
         return [_name_to_pickle(x) for x in node_attr]
 
+    # Nodes already hold their MFn and attribute, no need to resolve their name
+    if _is_node(node_attr):
+        return _node_uuid(node_attr, node_attr.__data__.attribute)
+
     split    = str(node_attr).split('.')
-    split[0] = mc.ls(split[0], uid=True)[0]
+    split[0] = _name_to_uuid(split[0])
     return '.'.join(split)
 
 
@@ -99,6 +220,14 @@ def _pickle_to_name(uuid_attr, uid=True):
         raise Exception('Node {} no longer in scene.'.format(uuid_attr))
 
 
+def _pickle_key(obj):
+    """ hashable fallback key for unhashable memoize arguments """
+    try:
+        return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return (type(obj).__name__, id(obj))
+
+
 def memoize(func):
     """ memoizes a function's return according to both args ans kargs """
     
@@ -108,37 +237,74 @@ def memoize(func):
     
     def _deep_float(*args):
         # When memoizing, we don't need to see the difference
-        # between ints and floats when making keys
+        # between ints and floats when making keys.
+        # Nodes are keyed by uuid so renamed nodes still hit the cache.
         args_  = []
         for x in args:
-            if x is None or _is_node(x) or isinstance(x, str):
+            
+            # plain python values are normalized right away,
+            # everything else goes through _classify
+            t = type(x)
+            if t is float or t is str or x is None:
+                args_.append(x)
+                continue
+            
+            if t is int:
+                args_.append(float(x))
+                continue
+            
+            if t is tuple or t is list:
+                args_.append(_deep_float(*x))
+                continue
+            
+            # Nodes key on their uuid and attribute without formatting a name
+            if t is Node:
+                data = x.__data__
+                args_.append((data.node.uuid().asString(), data.attribute))
+                continue
+            
+            kind = _classify(x)
+            if kind == _NODE or kind == _MATRIX:
+                args_.append(_name_to_pickle(x))
+                
+            elif kind == _STRING or x is None:
                 args_.append(x)
     
-            elif isinstance(x, numbers.Real):
+            elif kind == _SCALAR:
                 args_.append(float(x))
     
-            elif _is_sequence(x):
+            elif kind == _SEQUENCE or kind == _LIST:
                 args_.append(_deep_float(*x))
+            
+            # anything else keys by value, or by its pickle if unhashable
+            else:
+                try:
+                    hash(x)
+                    args_.append(x)
+                except TypeError:
+                    args_.append(_pickle_key(x))
     
-        return args_ 
+        return tuple(args_)
 
     
     
     @wraps(func)
     def wrapper(*args, **kargs):
         
-        # TODO: clean the cache?
-        
-        
-        # force all ints to floats to generate a common key
+        # force all ints to floats to generate a common hashable key
         args_  = _deep_float(*args)
-        kargs_ = dict(zip(kargs.keys(), _deep_float(*kargs.values())))
-        key    = hash(pickle.dumps((args_, kargs_, container.containers[:1])))
+        kargs_ = tuple(sorted((k, _deep_float(v)) for k, v in kargs.items()))
+        
+        # key on the root container on purpose, nested scopes are only
+        # None placeholders and all their nodes land in the root
+        ctx    = container.containers[0] if container.containers else None
+        key    = (args_, kargs_, _deep_float(ctx))
 
         if key in cache:
             result = cache[key]
-            if result.uuids:
-                if len(mc.ls(result.uuids)) == len(result.uuids):
+            if result.uuid_count:
+                if _uuids_exist(result.uuids):
+                    cache.move_to_end(key)
                     return result.data
                 else:
                     cache.pop(key, None)
@@ -151,22 +317,31 @@ def memoize(func):
         
         if not result.data is None:
             
+            nodes = []
             if _is_node(result.data):
-                result.uuids = [str(result.data).split('.')[0]]
+                nodes = [result.data]
                 
             elif _is_sequence(result.data):
-                for item in result.data:
-                    if _is_node(item):
-                        result.uuids.append(str(item).split('.')[0])
+                nodes = [x for x in result.data if _is_node(x)]
+
+            # convert to uuids, remembering the nodes for validation
+            for node in nodes:
+                uuid = _node_uuid(node)
+                _uuid_exists_cache[uuid] = om.MObjectHandle(node.__data__.node.object())
+                result.uuids.append(uuid)
+                
+            result.uuids = list(dict.fromkeys(result.uuids))
 
-            # convert to uuids
-            result.uuids = mc.ls(result.uuids, uuid=True)
+        result.uuid_count = len(result.uuids)
 
 
         cache[key] = result
+        if len(cache) > MEMOIZE_CACHE_SIZE:
+            cache.popitem(last=False) # drop the least recently used result
+            
         return result.data
 
-    cache = {}
+    cache = OrderedDict()
     return wrapper
 
 
@@ -201,16 +376,23 @@ def vectorize(func, favor_index=None):
                 if not favor_index is None:
                     max_count = len(args[favor_index])
     
-                count   = 0
-                for args_, kargs_ in arguments(*args, **kargs):
+                calls = arguments(*args, **kargs)
+                if not favor_index is None:
+                    calls = islice(calls, max_count)
+                
+                # let batched builders pack the calls into shared nodes
+                batched = getattr(func, '_batched', None)
+                if batched:
+                    calls   = list(calls)
+                    results = batched(calls) or []
+                    if results:
+                        calls = []
+
+                for args_, kargs_ in calls:
                     res = func(*args_, **kargs_)
                     if res:
                         results.append(res)
     
-                    count += 1
-                    if not favor_index is None and count == max_count:
-                        break
-    
             # run the function without vectorization
             else:
                 return func(*args, **kargs)
@@ -239,24 +421,72 @@ def vectorize(func, favor_index=None):
 
 
 
+def batched(lane):
+    """
+    Decorator that lets vectorize pack the scalar calls of a function
+    into the X, Y and Z lanes of shared multiplyDivide nodes.
+
+    lane(*args, **kargs) returns the (input1, input2, operation) of a call,
+    or None if that call can't be packed (numbers, compound plugs).
+    """
+    def decorator(func):
+        def _batched(calls):
+            lanes = []
+            for args_, kargs_ in calls:
+                lane_ = lane(*args_, **kargs_)
+                if lane_ is None:
+                    return None
+                lanes.append(lane_)
+            
+            if len(lanes) < 2 or len(set(x[2] for x in lanes)) > 1:
+                return None
+            
+            return _multiply_divide_lanes(lanes, name=f'{func.__name__}1')
+        
+        func._batched = _batched
+        return func
+    
+    return decorator
+
+
+
 # -------------------------------- UTILITIES --------------------------------- #
+def _cache_by_attribute(func):
+    """ caches a query on an attribute MObject, whose type never changes """
+    query = func.__name__
+    
+    @wraps(func)
+    def wrapper(attr):
+        handle = om.MObjectHandle(attr)
+        key    = (handle.hashCode(), query)
+        cached = _plug_type_cache.get(key)
+        if cached and cached[0].isValid():
+            return cached[1]
+        
+        result = func(attr)
+        _plug_type_cache[key] = (handle, result)
+        return result
+    
+    return wrapper
+
+
+# matches the attribute or data type flag of an addAttr command
+_ADD_ATTR_RE = re.compile(r'-(at|dt)\s+"([^"]*)"')
+
+@_cache_by_attribute
 def _getPlugType(attr):
     try:  
         if attr.hasFn(om.MFn.kAttribute):
-            attr_fn = om.MFnAttribute(attr)
-            kargs = attr_fn.getAddAttrCmd(longFlags=False).split()
-            
-            if '-at' in kargs:
-                return re.findall('"([^"]*)"', kargs[kargs.index('-at')+1])[0]
-                
-            elif '-dt' in kargs:
-                return re.findall('"([^"]*)"', kargs[kargs.index('-dt')+1])[0]
+            match = _ADD_ATTR_RE.search(om.MFnAttribute(attr).getAddAttrCmd(longFlags=False))
+            if match:
+                return match.group(2)
     except:
         pass
         
     return None
 
 
+@_cache_by_attribute
 def _plugIsMatrix(attr):
     #attr = plug.attribute()
     if attr.hasFn(om.MFn.kTypedAttribute):
@@ -266,6 +496,7 @@ def _plugIsMatrix(attr):
     return False
 
 
+@_cache_by_attribute
 def _plugIsAny(attr):
     #attr = plug.attribute()
     if attr.hasFn(om.MFn.kTypedAttribute):
@@ -274,6 +505,7 @@ def _plugIsAny(attr):
     
     return False
 
+@_cache_by_attribute
 def _plugIsCompound(attr):
     #attr = plug.attribute()
     if attr.hasFn(om.MFn.kCompoundAttribute):
@@ -283,6 +515,20 @@ def _plugIsCompound(attr):
     return None
 
 
+@_cache_by_attribute
+def _plugCompoundChildren(attr):
+    """ long names of every child under a compound attr, depth first like listAttr """
+    names   = []
+    attr_fn = om.MFnCompoundAttribute(attr)
+    for i in range(attr_fn.numChildren()):
+        child = attr_fn.child(i)
+        names.append(om.MFnAttribute(child).name)
+        if child.hasFn(om.MFn.kCompoundAttribute):
+            names.extend(_plugCompoundChildren(child))
+            
+    return names
+
+
 
 def _getAttrTypeFromPlug(plug):
     """
@@ -361,51 +607,51 @@ def _disconnect_attr(*args, **kargs):
 
 
 
-def _is_basestring(obj):
-    """ tests for basestring """
-    try:
-        return isinstance(obj, basestring) # python 2.7
-    except:
-        return isinstance(obj, str) # python 3
-
-def _is_list(obj):
-    """ tests if given input is a List class """
-    try:
-        return getattr(obj.__class__, '__CLASS_TYPE__', None) == 'List'
-    except Exception:
-        return False
-
-def _is_node(obj):
-    """ tests if given input is a Node class """
-    try:
-        return getattr(obj.__class__, '__CLASS_TYPE__', None) == 'Node'
-    except Exception:
-        return False
+def _classify(obj):
+    """ returns the kind of the given input in a single pass, without exceptions """
+    cls = type(obj)
+    if cls is float or cls is int:
+        return _SCALAR
     
-def _is_attribute(obj):
-    """ tests if given input is an Attribute class """
-    try:
-        return getattr(obj.__class__, '__CLASS_TYPE__', None) == 'Attribute'
-    except Exception:
-        return False
+    if cls is str:
+        return _STRING
+    
+    if cls is list or cls is tuple:
+        return _SEQUENCE
+    
+    type_id = getattr(cls, '__CLASS_TYPE_ID__', None)
+    if type_id is not None:
+        if type_id == _NODE and obj.__data__.type == 'matrix':
+            return _MATRIX
+        return type_id
+    
+    if isinstance(obj, numbers.Real):
+        return _SCALAR
+    
+    if isinstance(obj, str):
+        return _STRING
+    
+    if _is_sequence(obj):
+        return _SEQUENCE
+    
+    return _OTHER
+
 
 def _is_compound(obj):
     """ tests object has compound attrs """
-    try:
-        
-        # special case for choice nodes, which must be tested using their input plug
-        if obj.__data__.choice:
-            try:
-                choice_node = str(obj).split('.')[0]
-                return bool(Node(mc.listConnections(f'{choice_node}.input[0]', p=True, s=True, d=False)[0]).__data__.compound)
-            except:
-                pass
-        
-        return bool(obj.__data__.compound)
-    except:
-        pass
-        
-    return False
+    if not _is_node(obj):
+        return False
+    
+    data = obj.__data__
+    
+    # special case for choice nodes, which must be tested using their input plug
+    if data.choice:
+        choice_node = str(obj).partition('.')[0]
+        source = mc.listConnections(f'{choice_node}.input[0]', p=True, s=True, d=False)
+        if source:
+            return Node(source[0]).__data__.is_compound
+    
+    return data.is_compound
     
     
 #def _is_compound(obj):
@@ -418,10 +664,7 @@ def _is_compound(obj):
     
 def _is_array(obj):
     """ tests object has array attrs """
-    try:
-        return obj.__data__.array
-    except:
-        return False
+    return _is_node(obj) and obj.__data__.array
             
 
 def _get_attr_type(obj):
@@ -433,100 +676,111 @@ def _get_attr_type(obj):
 
 def _get_compound(obj):
     """ returns compound component (or sequence) """
-    try:
-        #return [Node('{}.{}'.format(obj, att)) for att in obj.__data__.compound]
-        return List([f'{obj}.{att}' for att in obj.__data__.compound])
-    except:
-        if _is_sequence(obj):
-            return obj
+    if _is_node(obj) and obj.__data__.compound:
         
-        #return [obj]
-        return List([obj])
-                    
-
-    
-def _is_sequence(obj):
-    """ tests if given input is a sequence """
-    
-    if _is_basestring(obj):
-        return False
+        # the children Nodes follow renames, build them once per Node
+        data = obj.__data__
+        if data.children is None:
+            data.children = List([f'{obj}.{att}' for att in data.compound])
+        
+        return List(data.children)
     
-    try:
-        len(obj)
-        if isinstance(obj, dict):
-            return False
-    except Exception:
-        return False
+    if _is_sequence(obj):
+        return obj
     
-    return True
-
-
+    #return [obj]
+    return List([obj])
+                    
 
+    
 def _is_matrix(obj):
-    try:
-        return obj.__data__.type == 'matrix'
-    except:
-        return False
+    return _is_node(obj) and obj.__data__.is_matrix
     
     
 def _is_quaternion(obj):
-    try:
-        if _is_compound(obj):
-            return len(obj.__data__.compound) == 4
-    except:
-        return False
+    return _is_node(obj) and obj.__data__.is_quaternion
     
     
 def _is_vector(obj):
-    try:
-        if _is_compound(obj):
-            return len(obj.__data__.compound) == 3
-    except:
-        return False   
+    return _is_compound(obj) and len(obj.__data__.compound or []) == 3
 
 def _is_transform(obj):
-    try:
-        return obj.__data__.transform == True
-    except:
-        return False
+    return _is_node(obj) and obj.__data__.transform == True
 
 def _is_control_point(obj):
-    try:
-        return obj.__data__.point == True
-    except:
-        return False    
+    return _is_node(obj) and obj.__data__.point == True
+
+    
+def _shorthand_kinds(obj):
+    """ returns the shorthand kinds of a Node, reading its data only once """
+    kinds = set()
+    if not _is_node(obj):
+        return kinds
+
+    data = obj.__data__
+    if data.type == 'matrix':
+        kinds.add('matrix')
+
+    if data.transform:
+        kinds.add('transform')
+
+    if data.point:
+        kinds.add('point')
+
+    if _is_compound(obj):
+        count = len(data.compound or [])
+        if count == 4:
+            kinds.add('quaternion')
+        elif count == 3:
+            kinds.add('vector')
+
+    return kinds
 
     
 @memoize    
 def _plus_minus_average(*args, operation=1, name='add1'):
+    # stops at the first compound arg
+    is_compound = any(_is_compound(x) for x in args)
+    plug   = 'input3D'  if is_compound else 'input1D'
+    output = 'output3D' if is_compound else 'output1D'
+    
     node = container.createNode('plusMinusAverage', name=name)
     node.operation << operation
 
-    if any([_is_compound(x) for x in args]):
-        for obj in args:
-            node.input3D << obj
-        return node.output3D
-
-    else:
-        for obj in args:
-            node.input1D << obj 
-        return node.output1D
+    # the array index resolves as each input plug is built
+    for obj in args:
+        node[plug] << obj
+    return node[output]
 
 
 @memoize
 def _multiply_divide(input1, input2, operation=1, name='mult1'):
+    # skip the second check if the first input is compound
+    suffix = '' if _is_compound(input1) or _is_compound(input2) else 'X'
+    
     node = container.createNode('multiplyDivide', name=name)
     node.operation << operation
 
-    if any([_is_compound(input1), _is_compound(input2)]):
-        node.input1 << input1
-        node.input2 << input2
-        return node.output
+    node[f'input1{suffix}'] << input1
+    node[f'input2{suffix}'] << input2
+    return node[f'output{suffix}']
+
+
+
+@memoize
+def _multiply_divide_lanes(lanes, name='mult1'):
+    """ packs (input1, input2, operation) scalar lanes 3 per multiplyDivide node """
+    outputs = List()
+    for i in range(0, len(lanes), 3):
+        node = container.createNode('multiplyDivide', name=name)
+        node.operation << lanes[i][2]
+        
+        for axis, (input1, input2, _) in zip('XYZ', lanes[i:i+3]):
+            node[f'input1{axis}'] << input1
+            node[f'input2{axis}'] << input2
+            outputs.append(node[f'output{axis}'])
     
-    else:
-        node.input1X << input1
-        node.input2X << input2
-        return node.outputX   
+    return outputs
 
 
 
@@ -558,9 +812,8 @@ def _compose_matrix(scale=None, rotate=None, translate=None, shear=None, rotate_
     # plug rotate
     if not rotate is None:
 
-        # is this a quaternion?
-        quat_test = _get_compound(rotate)
-        if len(quat_test) == 4:
+        # is this a quaternion? (test without building a List of the children)
+        if _is_quaternion(rotate) or (_is_sequence(rotate) and len(rotate) == 4):
             node.useEulerRotation << 0
             node.inputQuat << rotate
 
@@ -590,24 +843,16 @@ def _euler_to_quaternion(token, rotate_order=None):
 
 @memoize
 def _matrix_multiply(*tokens, **kargs):
-    local = ([kargs.pop(x) for x in list(kargs.keys()) if x in ['local']] or [None] )[-1]
+    local = kargs.pop('local', None)
     if kargs:      
         raise Exception('Unsupported keyword args: {}'.format(kargs.keys()))
 
     # are we doing point matrix mult?
     if len(tokens) == 2:
-        count = 0
-        matrix_index = 0
-        vector_index = 0
-
-        for i, obj in enumerate(tokens):
-            
-            if _is_matrix(obj):
-                matrix_index = i
-                count +=1
-            else:
-                vector_index = i
-            
+        is_matrix    = (_is_matrix(tokens[0]), _is_matrix(tokens[1]))
+        count        = is_matrix[0] + is_matrix[1]
+        matrix_index = 0 if is_matrix[0] else 1
+        vector_index = 1 - matrix_index
                 
         if count == 1:
             node = container.createNode('pointMatrixMult')
@@ -627,9 +872,9 @@ def _matrix_multiply(*tokens, **kargs):
 
 @memoize
 def _matrix_add(*tokens, **kargs):
-    weights = ([kargs.pop(x) for x in list(kargs.keys()) if x in ['weights']] or [None] )[-1]
+    weights = kargs.pop('weights', None)
     if kargs:      
-        raise Exception('Unsupported keyword args: {}'%kargs.keys()) 
+        raise Exception('Unsupported keyword args: {}'.format(kargs.keys())) 
 
 
     if weights is None:
@@ -738,15 +983,13 @@ def _condition_op(input0, op, input1):
             count0 = len(compound_input0)
             count1 = len(compound_input1) 
             count  = max(count0, count1)
-            output_plug  = _constant([0]*count, name='output_plug1')
-            output_plugs = _get_compound(output_plug)
+            output_plug, output_plugs = _constant_with_plugs([0]*count, name='output_plug1')
 
-            # publish the plugs
-            index = 0
+            # create every lane's condition node in one go, then wire them
+            lanes = list(sequences(compound_input0, compound_input1))
+            nodes = container.createNodes('condition', len(lanes), name=NAMES[op], ss=True)
 
-            for input0, input1 in sequences(compound_input0, compound_input1):
-                node = container.createNode('condition', name=NAMES[op], ss=True)
-                
+            for index, (node, (input0, input1)) in enumerate(zip(nodes, lanes)):
                 node.firstTerm    << input0 # set or connect first term
                 node.secondTerm   << input1 # set or connect second term
                 node.operation    << OPERATORS[op] # set condition
@@ -756,8 +999,6 @@ def _condition_op(input0, op, input1):
 
                 output_plugs[index] << node.outColorR
 
-                index += 1
-
 
         return output_plug
 
@@ -802,59 +1043,49 @@ def condition(condition_op, if_true, if_false):
 
     # build a setup and pipe the output to a vector
     else:
+        
+        compound_op     = _get_compound(condition_op)
+        compound_input0 = _get_compound(if_true)
+        compound_input1 = _get_compound(if_false)
+        
 
         with container('condition1'):
 
-            # create pass through plugs
-            compound_op     = _get_compound(condition_op)
-            compound_input0 = _get_compound(if_true)
-            compound_input1 = _get_compound(if_false)
-
-            # if the operator is all numbers
-            if all([isinstance(x, numbers.Real) for x in compound_op]):
-                result = []
-                for op, if_true, if_false in sequences(compound_op, compound_input0, compound_input1):
-                    if op:
-                        result.append(is_true)
-                    else:
-                        result.append(is_false)
-
-                return result
-
-
             # else, build a tree and publish the plugs
-            index = 0
             count0 = len(compound_input0)
             count1 = len(compound_input1) 
             count2 = len(compound_op) 
             count  = max(count0, count1, count2)
             
             # this will create a neat output plug when publishing nodes
-            if container.create_container and count == 3:
+            create_container = container.create_container
+            if create_container and count == 3:
                 output_plug  = container.createNode('plusMinusAverage', name='output_plug1').output3D
                 output_plugs = _get_compound(output_plug)
                 input_plugs  = _get_compound(output_plug.input3D)
                 
-            elif container.create_container and count == 1:
+            elif create_container and count == 1:
                 output_plug  = container.createNode('plusMinusAverage', name='output_plug1').output1D
                 output_plugs = _get_compound(output_plug)
                 input_plugs  = _get_compound(output_plug.input1D)
                 
-            elif container.create_container and count == 2:
+            elif create_container and count == 2:
                 output_plug  = container.createNode('plusMinusAverage', name='output_plug1').output2D
                 output_plugs = _get_compound(output_plug)
                 input_plugs  = _get_compound(output_plug.input2D)
             
             # use a constant
             else:
-                output_plug  = _constant([0]*count, name='output_plug1')
-                output_plugs = _get_compound(output_plug)
+                output_plug, output_plugs = _constant_with_plugs([0]*count, name='output_plug1')
                 input_plugs  = output_plugs
                 
             
             
-            for op, if_true, if_false in sequences(compound_op, compound_input0, compound_input1):
-
+            # numeric lanes pick their input right away, the others
+            # get a condition node, all created in one go
+            lanes = list(sequences(compound_op, compound_input0, compound_input1))
+            pending = []
+            for index, (op, if_true, if_false) in enumerate(lanes):
                 if isinstance(op, numbers.Real):
                     if op:
                         input_plugs[index] << if_true
@@ -862,19 +1093,20 @@ def condition(condition_op, if_true, if_false):
                         input_plugs[index] << if_false
 
                 else:
+                    pending.append(index)
                     
-                    node = container.createNode('condition', name='condition1', ss=True)
-                    
-                    node.firstTerm    << op # set or connect first term
-                    node.secondTerm   << 1 # set or connect second term
-                    node.operation    << 0 # set condition
-                    
-                    node.colorIfTrue  << if_true
-                    node.colorIfFalse << if_false
+            nodes = container.createNodes('condition', len(pending), name='condition1', ss=True)
+            for node, index in zip(nodes, pending):
+                op, if_true, if_false = lanes[index]
+                
+                node.firstTerm    << op # set or connect first term
+                node.secondTerm   << 1 # set or connect second term
+                node.operation    << 0 # set condition
+                
+                node.colorIfTrue  << if_true
+                node.colorIfFalse << if_false
 
-                    input_plugs[index] << node.outColorR
-                    
-                index += 1
+                input_plugs[index] << node.outColorR
 
 
         return output_plug    
@@ -892,6 +1124,8 @@ class Container():
     
     def __init__(self):
         self.containers       = [] # keep track of container depth
+        self.pending          = {} # uuids of nodes waiting to be added to the leaf container
+        self.decomposed       = {} # (root container uuid, matrix plug uuid) --> (MObjectHandle, decomposeMatrix)
         self.published        = None
         self.create_container = CREATE_CONTAINER
         self.skip_selection   = SKIP_SELECTION
@@ -921,6 +1155,9 @@ class Container():
     
     def __exit__(self, exception_type, exception_val, trace):
         
+        # commit any deferred node additions before taking inventory
+        self.flush_pending()
+        
         # upon exiting the interace, create an inventory of the contained
         # nodes and their published attrs or future node explorer interface
         if self.containers and len(self.containers) == 1:
@@ -940,13 +1177,40 @@ class Container():
         
         # set published state
         if not self.containers:
-            self.published = None
+            self.published  = None
+            self.decomposed = {}
             
 
           
             
             
     
+    def _decompose(self, src, rotate_order=None, any_order=False):
+        """ Returns a decomposeMatrix of src. With any_order, the caller
+            doesn't read rotations and any decompose already built for
+            src in this container is reused, whatever its rotate order.
+        """
+        # key on the root container like memoize, so a decompose built
+        # outside a container is never wired into one
+        key = None
+        if _is_node(src):
+            root = self.containers[0] if self.containers else None
+            key  = (_node_uuid(root) if root else None, _node_uuid(src, src.__data__.attribute))
+        
+        if any_order and key in self.decomposed:
+            handle, node = self.decomposed[key]
+            if handle.isValid():
+                return node
+        
+        node = _decompose_matrix(src, rotate_order=rotate_order)
+        if key and (key not in self.decomposed or not any_order or \
+                    not self.decomposed[key][0].isValid()):
+            handle = om.MObjectHandle(node.__data__.node.object())
+            self.decomposed[key] = (handle, node)
+            
+        return node
+    
+    
     def _cleanup_unit_conversion(self, plugs):
 
         # include any conversion nodes into the leaf container
@@ -965,8 +1229,17 @@ class Container():
 
         def _matrix_to_transform(src, dst):
 
-            attr = '.'.join(str(dst).split('.')[1:])
-            node = _decompose_matrix(src, rotate_order=dst.ro)
+            attr = dst.__data__.attribute
+            
+            scale     = ['scale',     'scaleX',     'scaleY',     'scaleZ']
+            rotate    = ['rotate',    'rotateX',    'rotateY',    'rotateZ']
+            translate = ['translate', 'translateX', 'translateY', 'translateZ']
+            shear     = ['shear',     'shearXY',    'shearXZ',    'shearYZ']
+            
+            # only rotations depend on the rotate order
+            any_order = attr in scale + translate + shear
+            
+            node = self._decompose(src, rotate_order=dst.ro, any_order=any_order)
             if not attr:
                 self.inject(node.outputScale,     dst.s)
                 self.inject(node.outputRotate,    dst.r)
@@ -974,16 +1247,16 @@ class Container():
                 self.inject(node.outputShear,     dst.shear)              
 
             else:
-                if attr in ['scale', 'scaleX', 'scaleY', 'scaleZ']:
+                if attr in scale:
                     self.inject(node.outputScale, dst)
 
-                elif attr in ['rotate', 'rotateX', 'rotateY', 'rotateZ']:
+                elif attr in rotate:
                     self.inject(node.outputRotate, dst) 
 
-                elif attr in ['translate', 'translateX', 'translateY', 'translateZ']:
+                elif attr in translate:
                     self.inject(node.outputTranslate, dst) 
 
-                elif attr in ['shear', 'shearXY', 'shearXZ', 'shearYZ']:
+                elif attr in shear:
                     self.inject(node.outputShear, dst)
 
                 else:
@@ -992,23 +1265,23 @@ class Container():
             return True
 
         def _matrix_to_quaternion(src, dst):
-            node = _decompose_matrix(src)
+            node = self._decompose(src, any_order=True)
             self.inject(node.outputQuat, dst)                    
             return True
 
         def _matrix_to_vector(src, dst):
-            node = _decompose_matrix(src, rotate_order=dst.ro)
+            node = self._decompose(src, rotate_order=dst.ro, any_order=True)
             self.inject(node, dst)
             return True
         
         def _matrix_to_point(src, dst):
-            transform = Node(mc.listRelatives(str(dst).split('.')[0], p=True)[0])
-            node = _decompose_matrix(src, rotate_order=transform.ro)
+            transform = Node(mc.listRelatives(str(dst).partition('.')[0], p=True)[0])
+            node = self._decompose(src, rotate_order=transform.ro, any_order=True)
             self.inject(node, dst)
             return True        
         
         def _quaternion_to_transform(src, dst):
-            attr = '.'.join(str(dst).split('.')[1:])
+            attr = dst.__data__.attribute
 
             if not attr:
                 node =_quaternion_to_euler(src, rotate_order=dst.ro)
@@ -1034,7 +1307,7 @@ class Container():
             return True
 
         def _vector_to_transform(src, dst):
-            attr = '.'.join(str(dst).split('.')[1:])
+            attr = dst.__data__.attribute
             if not attr:
                 self.inject(src, dst.t)
             else:
@@ -1053,10 +1326,10 @@ class Container():
             return True
 
         def _transform_to_quaternion(src, dst):
-            attr = '.'.join(str(src).split('.')[1:])
+            attr = src.__data__.attribute
 
             if not attr:
-                node = _decompose_matrix(src.matrix)
+                node = self._decompose(src.matrix, any_order=True)
                 self.inject(node.outputQuat, dst)
                 return True
 
@@ -1069,7 +1342,7 @@ class Container():
 
 
         def _transform_to_vector(src, dst):
-            attr = '.'.join(str(src).split('.')[1:])
+            attr = src.__data__.attribute
 
             if not attr:
                 self.inject(src.t, dst)
@@ -1080,7 +1353,7 @@ class Container():
 
         def _transform_to_matrix(src, dst):
             
-            attr = '.'.join(str(src).split('.')[1:])
+            attr = src.__data__.attribute
             if not attr:
                 self.inject(src.matrix, dst)
                 return True
@@ -1113,42 +1386,30 @@ class Container():
         if not self.use_shorthand:
             return False
 
-        if _is_matrix(src):
-            if _is_transform(dst):
-                return _matrix_to_transform(src, dst)
-            if _is_quaternion(dst):
-                return _matrix_to_quaternion(src, dst)
-            if _is_control_point(dst):
-                return _matrix_to_point(src, dst)
-            if _is_vector(dst):
-                return _matrix_to_vector(src, dst)
-
-
-        if _is_quaternion(src):
-            if _is_transform(dst):
-                return _quaternion_to_transform(src, dst)
-            if _is_vector(dst):
-                return _quaternion_to_vector(src, dst)
-            if _is_matrix(dst):
-                return _quaternion_to_matrix(src, dst)        
-
-            
-        if _is_transform(src):
-            if _is_quaternion(dst):
-                return _transform_to_quaternion(src, dst)
-            if _is_vector(dst) or _is_control_point(dst):
-                return _transform_to_vector(src, dst)
-            if _is_matrix(dst):
-                return _transform_to_matrix(src, dst)    
-
-        if _is_vector(src):
-            if _is_transform(dst):
-                return _vector_to_transform(src, dst)
-            if _is_quaternion(dst):
-                return _vector_to_quaternion(src, dst)
-            if _is_matrix(dst):
-                return _vector_to_matrix(src, dst)   
-
+        # first matching (src kind, dst kind) rule wins
+        RULES = (('matrix',     'transform',  _matrix_to_transform),
+                 ('matrix',     'quaternion', _matrix_to_quaternion),
+                 ('matrix',     'point',      _matrix_to_point),
+                 ('matrix',     'vector',     _matrix_to_vector),
+                 ('quaternion', 'transform',  _quaternion_to_transform),
+                 ('quaternion', 'vector',     _quaternion_to_vector),
+                 ('quaternion', 'matrix',     _quaternion_to_matrix),
+                 ('transform',  'quaternion', _transform_to_quaternion),
+                 ('transform',  'vector',     _transform_to_vector),
+                 ('transform',  'point',      _transform_to_vector),
+                 ('transform',  'matrix',     _transform_to_matrix),
+                 ('vector',     'transform',  _vector_to_transform),
+                 ('vector',     'quaternion', _vector_to_quaternion),
+                 ('vector',     'matrix',     _vector_to_matrix))
+
+        src_kinds = _shorthand_kinds(src)
+        if not src_kinds:
+            return False
+        
+        dst_kinds = _shorthand_kinds(dst)
+        for src_kind, dst_kind, handler in RULES:
+            if src_kind in src_kinds and dst_kind in dst_kinds:
+                return handler(src, dst)
 
         return False    
     
@@ -1192,33 +1453,47 @@ class Container():
             sets attr or connects [src] to [dst]
             [dst] is always presumed to be a Node with an attr
             """
-
+            
+            # resolve dst's current name once, str() on a Node queries its MFn
+            dst_name = str(dst)
             
             # is src a node?
             if _is_node(src):
                 if '.' in src:
-                    dst = str(dst)
-                    _disconnect_attr(dst)
-                    mc.connectAttr(str(src), dst, force=force)
-                    self._cleanup_unit_conversion(dst)
+                    src_name = str(src)
+                    incoming = mc.listConnections(dst_name, s=True, d=False, p=True)
+                    if incoming:
+                        # already wired, nothing to redo
+                        if mc.isConnected(src_name, dst_name, ignoreUnitConversion=True):
+                            return
+                        _disconnect_attr(incoming[0], dst_name)
+                        
+                    mc.connectAttr(src_name, dst_name, force=force)
+                    self._cleanup_unit_conversion(dst_name)
                 else:
                     raise Exception("No attribute specified for {}.".format(src))
             
             # is src a number?
             elif isinstance(src, numbers.Real):
-                try:
-                    mc.setAttr(str(dst), src)
-                except:
-                    for x, y in sequences([src], _get_compound(dst)):
+                
+                # a compound can't take a single value, broadcast it to the children
+                if _is_node(dst) and dst.__data__.is_compound:
+                    for y in _get_compound(dst):
                         try:
-                            mc.setAttr(str(y), x)
+                            mc.setAttr(str(y), src)
                         except:
-                            pass
+                            pass # locked or connected child
+                        
+                else:
+                    try:
+                        mc.setAttr(dst_name, src)
+                    except:
+                        pass
         
             # is data a string?
             elif _is_basestring(src):
                 try:
-                    mc.setAttr(str(dst), src, type='string')
+                    mc.setAttr(dst_name, src, type='string')
                 except:
                     pass
         
@@ -1227,14 +1502,25 @@ class Container():
             elif _is_sequence(src):
                 
                 # are we setting a matrix?
-                if _get_attr_type(dst) == 'matrix':
+                if _get_attr_type(dst_name) == 'matrix':
                     try:
-                        mc.setAttr(str(dst), *src, type='matrix')
+                        mc.setAttr(dst_name, *src, type='matrix')
                     except:
                         pass
                 
                 # try to set a vector, or quaternion
                 else:
+                    
+                    # all numbers matching the compound, set them in one go
+                    if _is_node(dst) and dst.__data__.compound and \
+                       len(src) == len(dst.__data__.compound) and \
+                       all(isinstance(x, numbers.Real) for x in src):
+                        try:
+                            mc.setAttr(dst_name, *src)
+                            return
+                        except:
+                            pass # locked or connected child, set them one by one
+                    
                     dst = _get_compound(dst)
                     if len(dst) < len(src):
                         src = src[:len(dst)]  
@@ -1252,6 +1538,10 @@ class Container():
                 raise Exception("Don't know how to handle {} for set/plug purposes.".format(dst))
             
     
+        # a plug can't drive itself
+        if src is dst:
+            return
+        
         # Disconnect Attr
         if src is None:
             _disconnect_attr(str(dst))        
@@ -1318,14 +1608,60 @@ class Container():
     
     
       
+    def createNodes(self, node_type, count, **kargs):
+        """ Creates count nodes of the same type and adds them
+            to the leaf container with a single container edit
+        """
+        add_to_container = kargs.pop('container', True)
+        if not 'ss' in kargs and not 'skipSelect' in kargs:
+            kargs['skipSelect'] = self.skip_selection
+        
+        nodes = [mc.createNode(node_type, **kargs) for _ in range(count)]
+        
+        if add_to_container and nodes:
+            self.add(nodes)
+        
+        return [Node(x) for x in nodes]
+    
+    
+    
     def add(self, nodes):
-        """ Adds given node to the leaf level container stack
+        """ Queues given node to be added to the leaf level container stack,
+            the container is edited once for all queued nodes by flush_pending
+        """
+        if self.containers and nodes:
+            if _is_basestring(nodes) or not _is_sequence(nodes):
+                nodes = [nodes]
+                
+            for node in nodes:
+                try:
+                    # track by uuid so renames before the flush don't matter
+                    self.pending[_name_to_uuid(str(node))] = None
+                except:
+                    pass
+    
+    
+    def flush_pending(self):
+        """ Adds all queued nodes to the leaf level container in one edit
         """
+        if not self.pending:
+            return
+        
+        uuids        = list(self.pending)
+        self.pending = {}
+        
         if self.containers:
-            try:
-                mc.container(self.containers[0], edit=True, addNode=nodes, force=True)
-            except:
-                pass
+            nodes = mc.ls(uuids) # current names, deleted nodes drop out
+            if nodes:
+                try:
+                    mc.container(self.containers[0], edit=True, addNode=nodes, force=True)
+                except:
+                    # one bad node shouldn't keep the others out
+                    for node in nodes:
+                        try:
+                            mc.container(self.containers[0], edit=True, addNode=node, force=True)
+                        except:
+                            pass
     
     
     def get_members(self):
@@ -1333,6 +1669,7 @@ class Container():
         Returns the members of the current leaf level container
         """
         if self.containers:
+            self.flush_pending()
             return mc.container(self.containers[0], q=True, nodeList=True)
         
         
@@ -1375,6 +1712,9 @@ class Container():
                                       attr_name=publish_name,
                                       connect=True)
             
+            # bound nodes must already be members of the container
+            self.flush_pending()
+            
             if _is_list(result):
                 for i, item in enumerate(result):
                     mc.container(self.containers[0], 
@@ -1405,7 +1745,9 @@ class Container():
     
     @staticmethod
     def _get_container_data(node):
-        data = mc.getAttr(f'{node}.__container_data__')
+        # read the plug straight from the cached MFn, no getAttr command
+        fn   = _node_fn(str(node))[0]
+        data = fn.findPlug('__container_data__', False).asString()
         data = pickle.loads(codecs.decode(data.encode(), "base64"))
         data['plugs'] = _pickle_to_name(data['plugs'], uid=False)
         data['nodes'] = _pickle_to_name(data['nodes'], uid=False)
@@ -1437,12 +1779,17 @@ class Container():
         # restore the scope
         mc.container(node, edit=True, addNode=data['nodes'], force=True)
         
-        # restore the published inputs and outputs
+        # restore the published inputs and outputs, the command only takes
+        # one publishAndBind pair so undo them as a single step instead
         if data['plugs'] is not None:
-            for i in range(len(data['plugs'])):
-                mc.container('cumsum1', 
-                             edit=True, 
-                             publishAndBind=[data['plugs'][i], data['names'][i]])
+            mc.undoInfo(openChunk=True, chunkName='collapse')
+            try:
+                for plug, name in zip(data['plugs'], data['names']):
+                    mc.container(node, 
+                                 edit=True, 
+                                 publishAndBind=[plug, name])
+            finally:
+                mc.undoInfo(closeChunk=True)
         
     
         if update:
@@ -1487,45 +1834,71 @@ def options(create_container = CREATE_CONTAINER,
 
 
 def _constant(values, name='constant1', dtype='double'):
+    return _constant_with_plugs(values, name=name, dtype=dtype)[0]
 
-    # input can be a node.attr, a list or a number    
-    DTYPE = {'double':float, 'float':float, 'long':int, 'int':int}
 
-    if not dtype in DTYPE:
-        raise Exception('{} is an undupported dtype.'.format(dtype))
+@memoize
+def _logical_sum(input1, input2):
+    """ count of truthy inputs, shared by &, | and ^ on the same operands """
+    return (input1!=0) + (input2!=0)
 
-    
+
+@memoize
+def _floor_divide(input1, input2):
+    """ floor(input1/input2), shared by // and the % fallback """
+    return _constant(input1/input2 - 0.4999999, dtype='long')
+
+
+
+def _constant_with_plugs(values, name='constant1', dtype='double'):
+    """ same as _constant, but also returns the List of value plugs
+        without enumerating the new attribute a second time
+    """
+
+    # input can be a node.attr, a list or a number    
+    DTYPE = {'double':float, 'float':float, 'long':int, 'int':int}
+
+    if not dtype in DTYPE:
+        raise Exception('{} is an undupported dtype.'.format(dtype))
+
+    
     # create a blank network node
     node = container.createNode('network', name=name)
 
     
-    # create a single value if count == 1
-    values = _get_compound(values)
-    count  = len(values)
+    # numbers are baked in as the attribute defaults at creation,
+    # only plugs need to be connected afterwards
+    node_name = str(node)
+    values    = _get_compound(values)
+    count     = len(values)
     if count == 1:
-        mc.addAttr(str(node), ln='value', at=dtype, k=True)
-        node.value << values[0]
+        if isinstance(values[0], numbers.Real):
+            mc.addAttr(node_name, ln='value', at=dtype, k=True, dv=DTYPE[dtype](values[0]))
+            plugs = List([node.value])
+        else:
+            mc.addAttr(node_name, ln='value', at=dtype, k=True)
+            plugs = List([node.value])
+            plugs[0] << values[0]
 
     # create a compound attr
     else:
-        values_ = []
-        attrs   = list('XYZW')
-        mc.addAttr(str(node), ln='value', at='{}{}'.format(dtype,count), k=True)
+        attrs = 'XYZW'
+        mc.addAttr(node_name, ln='value', at='{}{}'.format(dtype,count), k=True)
 
         for i in range(count):
-            mc.addAttr(str(node), ln='value{}'.format(attrs[i]), at=dtype, p='value', k=True)        
-
-            # set the value
             if isinstance(values[i], numbers.Real):
-                values_.append(DTYPE[dtype](values[i]))
+                mc.addAttr(node_name, ln=f'value{attrs[i]}', at=dtype, p='value', k=True, dv=DTYPE[dtype](values[i]))
             else:
-                values_.append(values[i])
+                mc.addAttr(node_name, ln=f'value{attrs[i]}', at=dtype, p='value', k=True)
 
-        node.value << values_
+        plugs = List([f'{node_name}.value{x}' for x in attrs[:count]])
+        for plug, value in zip(plugs, values):
+            if not value is None and not isinstance(value, numbers.Real):
+                plug << value
 
 
     # return node.value
-    return node.value
+    return node.value, plugs
 
 
 
@@ -1549,7 +1922,8 @@ class List(om.MObject):
              list_of_things[1:].r ---> [3.1415, 'pCube2.r', 'pCube3.r']
     """
 
-    __CLASS_TYPE__ = 'List'
+    __CLASS_TYPE__    = 'List'
+    __CLASS_TYPE_ID__ = _LIST
 
     def __init__(self, items=[]):
         self.__initialize__(items)
@@ -1578,6 +1952,10 @@ class List(om.MObject):
                         if isinstance(x, numbers.Real):
                             self.values.append(x)
                         
+                        # already resolved, share it rather than rebuild it
+                        elif _is_node(x):
+                            self.values.append(x)
+                        
                         elif ':' in str(x).split('.')[-1]:
                             for y in mc.ls(str(x), fl=True):
                                 self.values.append(Node(y))
@@ -1623,7 +2001,10 @@ class List(om.MObject):
         return reversed(self.values)
     
     def __contains__(self, item):
-        return item in [x.__str__() for x in self.values]
+        # compare names, a Node's == would build a condition network
+        if _is_node(item):
+            item = str(item)
+        return any(str(x) == item for x in self.values)
     
     def __reduce__(self):
         """ To allow @memoize of function args and kargs """
@@ -1639,16 +2020,10 @@ class List(om.MObject):
     # ---------------------------- LIST-like METHODS ----------------------------- #
             
     def append(self, item):
-        if isinstance(item, numbers.Real) or item is None:
-            self.values.append(item)
-        else:
-            self.values.append(Node(item))    
+        self.values.append(_list_item(item))
         
     def insert(self, ii, item):
-        if isinstance(item, numbers.Real) or item is None:
-            self.values.insert(ii, item)
-        else:
-            self.values.insert(ii, Node(item))
+        self.values.insert(ii, _list_item(item))
             
     def extend(self, item):
         if _is_list(item):
@@ -1721,200 +2096,6 @@ class List(om.MObject):
                 
     
 
-    # --------------------------- ARITHMETIC OPERATORS --------------------------- #
-    def __add__(self, other):
-        # x + y
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(x + y)
-        return result
-    
-    def __radd__(self, other):
-        # y + x
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(y + x)
-        return result
-    
-    def __sub__(self, other):
-        # x - y
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(x - y)
-        return result
-    
-    def __rsub__(self, other):
-        # y - x
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(y - x)  
-        return result
-    
-    def __mul__(self, other):
-        # x * y
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(x * y)    
-        return result
-    
-    def __rmul__(self, other):
-        # y * x
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(y * x)  
-        return result
-    
-    def __truediv__(self, other):
-        # x / y
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(x / y)
-        return result
-    
-    def __rtruediv__(self, other):
-        # y / x
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(y / x)   
-        return result
-    
-    def __pow__(self, other):
-        # x ** y
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(x ** y)     
-        return result
-    
-    def __rpow__(self, other):
-        # y ** x
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(y ** x)       
-        return result
-       
-    def __floordiv__(self, other):
-        # x // y
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(x // y) 
-        return result
-    
-    def __rfloordiv__(self, other):
-        # y // x
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(y // x)  
-        return result
-    
-    def __mod__(self, other):
-        # x % y
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(x % y)
-        return result
-    
-    def __rmod__(self, other):
-        # x % y
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(y % x)  
-        return result
-    
-    def __and__(self, other):
-        # x & y
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(x & y)    
-        return result
-    
-    def __rand__(self, other):
-        # y & x
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(y & x)   
-        return result
-    
-    def __or__(self, other):
-        # x | y
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(x | y)   
-        return result
-    
-    def __ror__(self, other):
-        # y | x
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(y | x)  
-        return result
-    
-    def __xor__(self, other):
-        # x ^ y
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(x ^ y)  
-        return result
-    
-    def __rxor__(self, other):
-        # y ^ x
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(y ^ x) 
-        return result     
-    
-    def __neg__(self):
-        # -x --> -1 * x
-        result = List()
-        for obj in self.values:
-            result.append(-obj)
-        return result
-    
-    def __invert__(self):
-        # ~x --> (1 - x)
-        result = List()
-        for obj in self.values:
-            result.append(~obj)   
-        return result
-    
-    
-    # --------------------------- COMPARISON OPERATOR ---------------------------- #
-    def __eq__(self, other):
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(x == y)  
-        return result
-    
-    def __ne__(self, other):
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(x != y)   
-        return result
-    
-    def __ge__(self, other):
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(x >= y)   
-        return result
-    
-    def __le__(self, other):
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(x <= y)  
-        return result
-    
-    def __gt__(self, other):
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(x > y) 
-        return result
-    
-    def __lt__(self, other):
-        result = List()
-        for x, y in sequences(self.values, other):
-            result.append(x < y) 
-        return result
-
-
     # --------------------- PYTHON 2.7 COMPATIBILITY METHODS --------------------- #
     def __getslice__(self, i, j):
         return self.__getitem__(slice(i, j))
@@ -1928,185 +2109,374 @@ class List(om.MObject):
 
 
 
+def _list_item(item):
+    """ numbers, None and Nodes are stored as is, anything else becomes a Node """
+    if isinstance(item, numbers.Real) or item is None or _is_node(item):
+        return item
+    return Node(item)
+
+
+_NUMERIC_TYPES = (int, float, bool)
+
+def _all_numeric(values):
+    """ True if every value is a plain python number """
+    return all(type(x) in _NUMERIC_TYPES for x in values)
+
+
+def _pad_last(values, count):
+    """ extends values to count by repeating its last entry, like sequences() """
+    missing = count - len(values)
+    return values if not missing else list(values) + [values[-1]] * missing
+
+
+def _numeric_operands(values, other):
+    """ returns values and other as matching plain number sequences,
+        None if either holds anything other than numbers
+    """
+    if not _all_numeric(values):
+        return None
+
+    if type(other) in _NUMERIC_TYPES:
+        return values, [other] * len(values)
+
+    if _is_list(other):
+        other = other.values
+    elif not isinstance(other, (list, tuple)):
+        return None
+
+    if not _all_numeric(other):
+        return None
+    
+    if len(other) == len(values):
+        return values, other
+    
+    # the shorter side is capped to its last entry
+    if values and other:
+        count = max(len(values), len(other))
+        return _pad_last(values, count), _pad_last(other, count)
+
+    return None
+
+
+def _list_binary(op, reflected=False):
+    """ builds a List operator applying op item by item """
+    if reflected:
+        def method(self, other):
+            result   = List()
+            operands = _numeric_operands(self.values, other)
+            if operands:
+                result.values[:] = list(map(op, operands[1], operands[0]))
+            else:
+                result.values[:] = [_list_item(op(y, x)) for x, y in sequences(self.values, other)]
+            return result
+    else:
+        def method(self, other):
+            result   = List()
+            operands = _numeric_operands(self.values, other)
+            if operands:
+                result.values[:] = list(map(op, *operands))
+            else:
+                result.values[:] = [_list_item(op(x, y)) for x, y in sequences(self.values, other)]
+            return result
+    return method
+
+
+def _list_unary(op):
+    """ builds a List unary operator applying op item by item """
+    def method(self):
+        result = List()
+        result.values[:] = [_list_item(op(x)) for x in self.values]
+        return result
+    return method
+
+
+# --------------------------- ARITHMETIC OPERATORS --------------------------- #
+for _name, _op in (('add',      operator.add),
+                   ('sub',      operator.sub),
+                   ('mul',      operator.mul),
+                   ('truediv',  operator.truediv),
+                   ('pow',      operator.pow),
+                   ('floordiv', operator.floordiv),
+                   ('mod',      operator.mod),
+                   ('and',      operator.and_),
+                   ('or',       operator.or_),
+                   ('xor',      operator.xor)):
+    setattr(List, f'__{_name}__',  _list_binary(_op))               # x + y
+    setattr(List, f'__r{_name}__', _list_binary(_op, reflected=True)) # y + x
+
+List.__neg__    = _list_unary(operator.neg)    # -x --> -1 * x
+List.__invert__ = _list_unary(operator.invert) # ~x --> (1 - x)
+
+
+# --------------------------- COMPARISON OPERATOR ---------------------------- #
+for _name, _op in (('eq', operator.eq),
+                   ('ne', operator.ne),
+                   ('ge', operator.ge),
+                   ('le', operator.le),
+                   ('gt', operator.gt),
+                   ('lt', operator.lt)):
+    setattr(List, f'__{_name}__', _list_binary(_op))
+
+List.__hash__ = None # comparisons return Lists, keep List unhashable
+del _name, _op
+
+
+
+
 def _resolve_attribute(token):
     """
     Resolves any attributes to long form and appends any missing index.
+    Resolutions without an extrapolated index are cached while the node
+    keeps its name.
     """
-    token = str(token)
-    is_point = False
-    
-    # if we have an attribute
-    if '.' in token:
-        
-        # resolve aliases
-        tracker  = om.MSelectionList()
-        indexed  = token.endswith(']')
-        index    = None
-        
+    # a Node was resolved when it was built
+    if _is_node(token):
+        return str(token), token.__data__.point
+    
+    token  = str(token)
+    cached = _resolve_cache.get(token)
+    if cached:
+        handle, resolved, is_point = cached
+        if _handle_is_named(handle, token.partition('.')[0]):
+            _resolve_cache.move_to_end(token)
+            return resolved, is_point
+    
+    resolved, is_point = _resolve_attribute_uncached(token)
+    resolved = sys.intern(resolved) # the same plugs are resolved over and over
+    
+    # an index appended to an array plug depends on its connections, don't cache it,
+    # and components resolved onto a shape (curve.cv[3]) would never pass the name check
+    name = token.partition('.')[0]
+    if '.' in token and (token.endswith(']') or not resolved.endswith(']')) and \
+       resolved.partition('.')[0] == name:
         try:
-            tracker.add(token) # try adding the token as is
+            obj = om.MGlobal.getSelectionListByName(name).getDependNode(0)
+            _resolve_cache[token] = (om.MObjectHandle(obj), resolved, is_point)
+            if len(_resolve_cache) > MEMOIZE_CACHE_SIZE:
+                _resolve_cache.popitem(last=False)
         except:
-            tracker.add(f'{token}[0]') # in case of un-indexed alias eg: pCube1.vtx
-            
+            pass
+    
+    return resolved, is_point
 
-        # catch supported controlPoints
-        try:   
-            dag_path, component = tracker.getComponent(0)
 
-            if component.apiTypeStr in ['kMeshVertComponent',
-                                        'kCurveCVComponent',
-                                        'kSurfaceCVComponent',
-                                        'kLatticeComponent',
-                                        'kMeshMapComponent']:
+
+# one selection list per thread, reused by every resolution
+_tracker_pool = threading.local()
+
+def _pooled_tracker():
+    """ returns this thread's cleared MSelectionList """
+    tracker = getattr(_tracker_pool, 'tracker', None)
+    if tracker is None:
+        tracker = _tracker_pool.tracker = om.MSelectionList()
+    else:
+        tracker.clear()
         
-                geometry  = om.MItGeometry(dag_path, component)
-                name      = dag_path.partialPathName()
-                index     = geometry.index()
-                is_point  = True
-                attr_name = 'controlPoints'
-                
-                if component.apiTypeStr == 'kMeshMapComponent':
-                    attr_name = 'uvpt'
-                    is_point  = False
-                
+    return tracker
 
-                # if this was an indexed token, return contolPoint
-                if indexed:
-                    return f'{name}.{attr_name}[{index}]', is_point
-                
-                # reset the tracker to the proper plug
-                else:
-                    tracker.clear()
-                    tracker.add(f'{name}.{attr_name}')
-                   
-        except:
-            pass
-                
-                
-        # resolve the alias
-        token = tracker.getSelectionStrings()[0]
-         
+
+def _resolve_attribute_uncached(token):
+    is_point = False
+    
+    # plain node names have nothing to resolve
+    if not '.' in token:
+        return token, is_point
+    
+    # resolve aliases
+    tracker  = _pooled_tracker()
+    indexed  = token.endswith(']')
+    index    = None
+    
+    try:
+        tracker.add(token) # try adding the token as is
+    except:
+        tracker.add(f'{token}[0]') # in case of un-indexed alias eg: pCube1.vtx
+        
+
+    # catch supported controlPoints
+    try:   
+        dag_path, component = tracker.getComponent(0)
+
+        if component.apiTypeStr in ['kMeshVertComponent',
+                                    'kCurveCVComponent',
+                                    'kSurfaceCVComponent',
+                                    'kLatticeComponent',
+                                    'kMeshMapComponent']:
+    
+            geometry  = om.MItGeometry(dag_path, component)
+            name      = dag_path.partialPathName()
+            index     = geometry.index()
+            is_point  = True
+            attr_name = 'controlPoints'
             
-        # extrapolate a default index if plug is array and no index given
-        try:
-            plug = tracker.getPlug(0)
-            if not indexed and plug.isArray:
-                index = 0     
-                try:
-                    # if control point, find the first unconnected point
-                    if is_point:
-                        if plug.numConnectedElements():
-                            for i in range(plug.numElements()-1, -1, -1):
-                                if not plug.elementByLogicalIndex(i).isConnected:
-                                    index = i
-                              
-            
-                    # numeric array, find the next unset index
-                    else:
-                        try:
-                            index = plug.elementByPhysicalIndex(plug.numElements()-1).logicalIndex()+1
-                        except:
-                            index = 0
-                except:
-                    pass  
-        except:
-            pass
+            if component.apiTypeStr == 'kMeshMapComponent':
+                attr_name = 'uvpt'
+                is_point  = False
+            
+
+            # if this was an indexed token, return contolPoint
+            if indexed:
+                return f'{name}.{attr_name}[{index}]', is_point
+            
+            # reset the tracker to the proper plug
+            else:
+                tracker.clear()
+                tracker.add(f'{name}.{attr_name}')
+               
+    except:
+        pass
+            
+            
+    # resolve the alias
+    token = tracker.getSelectionStrings()[0]
+     
         
+    # extrapolate a default index if plug is array and no index given
+    try:
+        plug = tracker.getPlug(0)
+        if not indexed and plug.isArray:
+            index = 0     
+            try:
+                # if control point, find the first unconnected point
+                if is_point:
+                    if plug.numConnectedElements():
+                        for i in range(plug.numElements()-1, -1, -1):
+                            if not plug.elementByLogicalIndex(i).isConnected:
+                                index = i
+                          
+        
+                # numeric array, find the next unset index
+                else:
+                    try:
+                        index = plug.elementByPhysicalIndex(plug.numElements()-1).logicalIndex()+1
+                    except:
+                        index = 0
+            except:
+                pass  
+    except:
+        pass
+    
  
-        # append extrapolated index and record the attribute
-        if not index is None:
-            token = f'{token}[{index}]'
+    # append extrapolated index and record the attribute
+    if not index is None:
+        token = f'{token}[{index}]'
 
 
     # force partial name (pCube1 --> pCubeShape1)
     try:
         name = tracker.getDagPath(0).partialPathName()
-        token = token.split('.')
-        token[0] = name
-        return '.'.join(token), is_point
+        _, dot, attr = token.partition('.')
+        return f'{name}{dot}{attr}', is_point
     except:
         return token, is_point
 
 
               
+def _node_child(parent, parent_name, token):
+    """ builds the Node of an attribute on parent, its node data is
+        reused when the token still resolves to the parent's node
+    """
+    child = Node.__new__(Node, token)
+    child.__dict__['__parent__'] = (parent_name.partition('.')[0], parent.__data__)
+    child.__init__(token)
+    return child
+
+
+
+class _NodeData():
+    """ per Node data, slotted since every Node carries one """
+    __slots__ = ('node',        # stores proper MFn used to query data
+                 'attribute',   # stores a str()  of the attribute
+                 'compound',    # stores a list() of the compound children names
+                 'is_compound', # True if compound has children, precomputed for inject
+                 'is_matrix',   # True if attr is a matrix, precomputed for operators
+                 'is_quaternion', # True if attr is a 4 child compound, precomputed for operators
+                 'children',    # caches the List() of the compound children Nodes
+                 'type',        # stores a str()  of the attribute type
+                 'index',       # stores the index of a compound child
+                 'any',         # True if plug is any (ex: choice node)
+                 'transform',   # True if node is a dag transform
+                 'choice',      # True if node is type choice
+                 'point',       # True if attr is a control point (.vtx, .cv, etc...)
+                 'array')       # True if attr is array attr (.input[0], .input[1], etc...)
+    
+    def __init__(self):
+        # defaults in __slots__ order, set in a single assignment
+        (self.node, self.attribute, self.compound, self.is_compound,
+         self.is_matrix, self.is_quaternion, self.children, self.type,
+         self.index, self.any, self.transform, self.choice, self.point,
+         self.array) = _NODE_DATA_DEFAULTS
+
+
+_NODE_DATA_DEFAULTS = (None, None, None, False, False, False, None, None, None, False, False, False, False, False)
+
+
+
 class Node(str):
 
-    __CLASS_TYPE__ = 'Node'
+    __CLASS_TYPE__    = 'Node'
+    __CLASS_TYPE_ID__ = _NODE
     
 
     def __init__(self, token):
-
-        # empty namespace to hold data
-        class namespace():
-            pass
-    
         """
         sets the object's internal data structure
         """
         tracker = om.MSelectionList() 
-        self.__dict__['__data__'] = namespace()
-        self.__data__.node      = None  # stores proper MFn used to query data
-        self.__data__.attribute = None  # stores a str()  of the attribute
-        self.__data__.compound  = None  # stores a list() of the compound children names
-        self.__data__.type      = None  # stores a str()  of the attribute type
-        self.__data__.index     = None  # stores the index of a compound child
-        self.__data__.any       = False # True if plug is any (ex: choice node)          
-        self.__data__.transform = False # True if node is a dag transform
-        self.__data__.choice    = False # True if node is type choice
-        self.__data__.point     = False # True if attr is a control point (.vtx, .cv, etc...)
-        self.__data__.array     = False # True if attr is array attr (.input[0], .input[1], etc...)
-        
-            
-        # Resolve any missing index and attribute long names
-        token, is_point = _resolve_attribute(token)
+        self.__dict__['__data__'] = _NodeData()
+        
+            
+        # Resolve any missing index and attribute long names,
+        # __new__ has already done it once
+        token, is_point = self.__dict__.pop('__resolved__', None) or _resolve_attribute(token)
+        
+        # split the token once, node.attribute
+        node_name, is_plug, attribute = token.partition('.')
 
         # do we have a plug?
-        if '.' in token:
-            self.__data__.array = token.endswith(']')
+        if is_plug:
+            is_array = token.endswith(']')
+            self.__data__.array = is_array
             self.__data__.point = is_point
 
             # get some plug info
-            if not self.__data__.array:
-                tracker.add(token)
-            else:
-                last_index = '['.join(token.split('[')[:-1])
-                tracker.add(last_index)
+            tracker.add(token.rpartition('[')[0] if is_array else token)
                 
                 
             plug = tracker.getPlug(0)
             attr = plug.attribute()            
             self.__data__.type     = _getPlugType(attr)
+            self.__data__.is_matrix = self.__data__.type == 'matrix'
             self.__data__.any      = _plugIsAny(attr)
             self.__data__.compound = _plugIsCompound(attr)
             
 
-            # store the long attribute
-            self.__data__.attribute = '.'.join(token.split('.')[1:])
+            # store the long attribute, shared by every Node on that attribute
+            self.__data__.attribute = sys.intern(attribute)
                     
                     
             # set the compound attrs, or compound child index
             if not self.__data__.compound is None:
-                full_plug = tracker.getSelectionStrings(0)
-                self.__data__.compound = [x.split('.')[-1] for x in mc.listAttr(full_plug)[1:]]
-            else:
-                try:
-                    self.__data__.index = mc.listAttr(plug.parent().name())[1:].index('.'.join(plug.name().split('.')[1:]))            
-                except:
-                    pass
+                self.__data__.compound = list(_plugCompoundChildren(attr))
+                self.__data__.is_compound = bool(self.__data__.compound)
+                self.__data__.is_quaternion = len(self.__data__.compound) == 4
+            elif plug.isChild:
+                siblings = _plugCompoundChildren(plug.parent().attribute())
+                attr_name = om.MFnAttribute(attr).name
+                if attr_name in siblings:
+                    self.__data__.index = siblings.index(attr_name)
              
              
-        # finally, check if token is a transform
-        inherited = mc.nodeType(token, inherited=True)
-        self.__data__.transform = 'transform' in inherited
-        self.__data__.choice = 'choice' in inherited
-        
-        # store the proper function to track the node's name
-        obj = om.MGlobal.getSelectionListByName(token).getDependNode(0)
-    
-        if tuple(filter(obj.hasFn, (om.MFn.kTransform, om.MFn.kPluginLocatorNode, om.MFn.kShape, om.MFn.kWorld))):
-            self.__data__.node = om.MFnDagNode(obj)
+        # finally, store the function tracking the node's name and its kind,
+        # shared by every Node of the same scene node
+        parent = self.__dict__.pop('__parent__', None)
+        if parent and parent[0] == node_name:
+            parent_data = parent[1]
+            self.__data__.node      = parent_data.node
+            self.__data__.transform = parent_data.transform
+            self.__data__.choice    = parent_data.choice
         else:
-            self.__data__.node = om.MFnDependencyNode(obj)
+            self.__data__.node, self.__data__.transform, self.__data__.choice = _node_fn(node_name)
             
             
         
@@ -2116,8 +2486,10 @@ class Node(str):
         TODO: THIS IS JUST FOR REAL TIME MAYA DEBUG SO
               PROPER INDEX SHOWS UP WHEN HIGHLIGHT-EXECUTE
         """
-        token = _resolve_attribute(token)[0]
-        return super().__new__(cls, token)
+        resolved = _resolve_attribute(token)
+        obj = super().__new__(cls, resolved[0])
+        obj.__dict__['__resolved__'] = resolved # handed over to __init__
+        return obj
 
 
        
@@ -2129,7 +2501,8 @@ class Node(str):
         node = self.__data__.node
         attr = self.__data__.attribute
         
-        if node.hasUniqueName():
+        # only dag nodes can share a name, skip the uniqueness test for the rest
+        if type(node) is om.MFnDependencyNode or node.hasUniqueName():
             node = node.name()
         else:
             node = node.fullPathName()        
@@ -2141,10 +2514,8 @@ class Node(str):
     
     
     def __hash__(self):
-        # returns a hash built from the uuid
-        split = str(self).split('.')
-        split[0] = mc.ls(split[0], uid=True)[0]
-        return hash('.'.join(split))
+        # returns a hash built from the uuid, read from the MFn instead of mc.ls
+        return hash((self.__data__.node.uuid().asString(), self.__data__.attribute))
         
         
 
@@ -2157,13 +2528,18 @@ class Node(str):
 
         # if name is _ or ____, clear attribute
         if attr and not attr.strip('_'):
-            return Node(node.split('.')[0])        
+            return Node(node.partition('.')[0])        
 
+        # a plain node has no attribute stack to fall back from
+        name, dot, _ = node.partition('.')
+        if not dot:
+            return _node_child(self, node, name + '.' + attr)
+        
         # append name to attribute stack 
         try:
-            return Node(f'{node}.{attr}')
+            return _node_child(self, node, node + '.' + attr)
         except:
-            return Node(f"{node.split('.')[0]}.{attr}")
+            return _node_child(self, node, name + '.' + attr)
         
 
 
@@ -2173,7 +2549,7 @@ class Node(str):
         node = str(self)
 
         if node.endswith(']'):
-            node = '['.join(node.split('[')[:-1])
+            node = node.rpartition('[')[0]
 
 
         # if given a string, rebuild as node.attr
@@ -2191,32 +2567,34 @@ class Node(str):
         if self.__data__.point:
             elements = mc.ls('{}[*]'.format(node), fl=True)
             
-            # hack to fix closed curves who will add additional control points
-            elements = list(dict.fromkeys(mc.ls(elements)))
+            # hack to fix closed curves who will add additional control points,
+            # only nurbs can wrap around so other shapes skip the second pass
+            obj = self.__data__.node.object()
+            if obj.hasFn(om.MFn.kNurbsCurve) or obj.hasFn(om.MFn.kNurbsSurface):
+                elements = list(dict.fromkeys(mc.ls(elements)))
 
         else:
+            # list the existing elements once, used for both names and max index
             try:
-                name = '.'.join(node.split('.')[:-1])
-                elements = [f'{name}.{x}' for x in mc.listAttr('{}[*]'.format(node))]
-                
+                attrs = mc.listAttr('{}[*]'.format(node)) or []
             except:
-                elements = []
+                attrs = []
+                
+            name = node.rpartition('.')[0]
+            elements = [f'{name}.{x}' for x in attrs]
                 
                 
             # find the max index, if user asks for a higher index on a multiattr,
             # give the user what they ask.
-            index = None
-            try:
-                # using this instead of testing size via getAttr(size=True) to get
-                # the index of the last available plug
-                for attr in mc.listAttr('{}[*]'.format(node))[::-1]:
-                    
-                    # ignore compounds
-                    if '[' in attr and not '.' in attr:
-                        index = int(attr.split('[')[1][:-1])+1
-                        break
-            except:
-                index = 0            
+            # using this instead of testing size via getAttr(size=True) to get
+            # the index of the last available plug
+            index = None if attrs else 0
+            for attr in reversed(attrs):
+                
+                # ignore compounds
+                if '[' in attr and not '.' in attr:
+                    index = int(attr.partition('[')[2][:-1])+1
+                    break
             
             
             if not index is None:
@@ -2242,6 +2620,8 @@ class Node(str):
 
     def __contains__(self, item):
         """ 'Cube' in Node('pCube1.tx') ---> True """ 
+        if _is_node(item):
+            item = str(item)
         return item in str(self)
 
     def __reduce__(self):
@@ -2295,11 +2675,11 @@ class Node(str):
     def __add__(self, other):
         
         # Are we doing matrix addition
-        if _is_matrix(self):
+        if self.__data__.is_matrix:
             return _matrix_add(self, other)
 
         # Or Quaternion?
-        elif _is_quaternion(self):
+        elif self.__data__.is_quaternion:
             return _quaternion_add(self, other)
         
         # Or a point Matrix multiplication?
@@ -2311,11 +2691,11 @@ class Node(str):
     @memoize
     def __radd__(self, other):
         # Are we doing matrix addition
-        if _is_matrix(self):
+        if self.__data__.is_matrix:
             return _matrix_add(other, self)
     
         # Or Quaternion?
-        elif _is_quaternion(self):
+        elif self.__data__.is_quaternion:
             return _quaternion_add(other, self)
     
         # Or a point Matrix multiplication?
@@ -2326,11 +2706,11 @@ class Node(str):
     @memoize
     def __sub__(self, other):
         # Are we doing matrix subtraction
-        if _is_matrix(self):
+        if self.__data__.is_matrix:
             return _matrix_multiply(self, _matrix_inverse(other))
         
         # Or Quaternion?
-        elif _is_quaternion(self):
+        elif self.__data__.is_quaternion:
             return _quaternion_subtract(self, other)        
         
         # x - y
@@ -2340,11 +2720,11 @@ class Node(str):
     @memoize
     def __rsub__(self, other):
         # Are we doing matrix subtraction
-        if _is_matrix(self):
+        if self.__data__.is_matrix:
             return _matrix_multiply(_matrix_inverse(other), self)
         
         # Or Quaternion?
-        elif _is_quaternion(self):
+        elif self.__data__.is_quaternion:
             return _quaternion_subtract(other, self)        
         
         # x - y
@@ -2355,11 +2735,11 @@ class Node(str):
     def __mul__(self, other):
         
         # mult matrix
-        if _is_matrix(self) or _is_matrix(other):
+        if self.__data__.is_matrix or _is_matrix(other):
             return _matrix_multiply(self, other)
         
         # Or Quaternion?
-        elif _is_quaternion(self) or _is_quaternion(other):
+        elif self.__data__.is_quaternion or _is_quaternion(other):
             return _quaternion_multiply(self, other)
         
         # x * y
@@ -2368,11 +2748,11 @@ class Node(str):
     @memoize
     def __rmul__(self, other):
         # mult matrix
-        if _is_matrix(self) or _is_matrix(other):
+        if self.__data__.is_matrix or _is_matrix(other):
             return _matrix_multiply(other, self)
         
         # Or Quaternion?
-        elif _is_quaternion(self) or _is_quaternion(other):
+        elif self.__data__.is_quaternion or _is_quaternion(other):
             return _quaternion_multiply(other, self)
         
         # x * y
@@ -2407,7 +2787,7 @@ class Node(str):
             input1 = container.publish_input(self,  'input1')
             input2 = container.publish_input(other, 'input2')
             
-            output = _constant(input1/input2 - 0.4999999, dtype='long')
+            output = _floor_divide(input1, input2)
             
             return container.publish_output(output, 'output')  
 
@@ -2418,7 +2798,7 @@ class Node(str):
             input1 = container.publish_input(other, 'input1')
             input2 = container.publish_input(self,  'input2')
             
-            output = _constant(input1/input2 - 0.4999999, dtype='long')
+            output = _floor_divide(input1, input2)
             
             return container.publish_output(output, 'output')
         
@@ -2462,7 +2842,7 @@ class Node(str):
             input_plug   = container.publish_input(self,  'input')
             modulus_plug = container.publish_input(other, 'modulus')
             
-            output = self - _constant(input_plug/modulus_plug - 0.4999999, dtype='long') * other
+            output = self - _floor_divide(input_plug, modulus_plug) * other
             
             return container.publish_output(output, 'output')
             
@@ -2505,7 +2885,7 @@ class Node(str):
             input_plug   = container.publish_input(other, 'input')
             modulus_plug = container.publish_input(self,  'modulus')
             
-            output = self - _constant(input_plug/modulus_plug - 0.4999999, dtype='long') * other
+            output = other - _floor_divide(input_plug, modulus_plug) * self
             
             return container.publish_output(output, 'output')
 
@@ -2522,7 +2902,7 @@ class Node(str):
             input1 = container.publish_input(self,  'input1')
             input2 = container.publish_input(other, 'input2')
             
-            output = ((input1!=0) + (input2!=0)) == 2
+            output = _logical_sum(input1, input2) == 2
             
             return container.publish_output(output, 'output')
             
@@ -2534,7 +2914,7 @@ class Node(str):
             input1 = container.publish_input(other, 'input1')
             input2 = container.publish_input(self,  'input2')
             
-            output = ((input1!=0) + (input2!=0)) == 2
+            output = _logical_sum(input1, input2) == 2
             
             return container.publish_output(output, 'output')
         
@@ -2547,7 +2927,7 @@ class Node(str):
             input1 = container.publish_input(self,  'input1')
             input2 = container.publish_input(other, 'input2')
             
-            output = ((input1!=0) + (input2 != 0)) > 0
+            output = _logical_sum(input1, input2) > 0
         
             return container.publish_output(output, 'output')
 
@@ -2559,7 +2939,7 @@ class Node(str):
             input1 = container.publish_input(other, 'input1')
             input2 = container.publish_input(self,  'input2')
             
-            output = ((input1!=0) + (input2 != 0)) > 0
+            output = _logical_sum(input1, input2) > 0
         
             return container.publish_output(output, 'output')
         
@@ -2571,7 +2951,7 @@ class Node(str):
             input1 = container.publish_input(self,  'input1')
             input2 = container.publish_input(other, 'input2')
             
-            output = ((input1!=0) + (input2 != 0)) == 1
+            output = _logical_sum(input1, input2) == 1
             
             return container.publish_output(output, 'output')
 
@@ -2582,38 +2962,33 @@ class Node(str):
             input1 = container.publish_input(other, 'input1')
             input2 = container.publish_input(self,  'input2')
             
-            output = ((input1!=0) + (input2 != 0)) == 1
+            output = _logical_sum(input1, input2) == 1
             
             return container.publish_output(output, 'output')
 
-    @memoize    
+    # the helpers are memoized already, no need to cache these twice
     def __neg__(self):
         # -x --> -1 * x
         return _multiply_divide(self, -1, operation=1, name='negate1')
 
-    @memoize
     def __invert__(self):
         # ~x --> (1 - x)
         return _plus_minus_average(1, self, operation=2, name='invert1')
     
     
     # --------------------------- COMPARISON OPERATOR ---------------------------- #
-    @memoize
+    # _condition_op is memoized on (self, op, other) already,
+    # a second cache here would only build the same key twice
     def __eq__(self, other):
         return _condition_op(self, '==', other)
-    @memoize
     def __ne__(self, other):
         return _condition_op(self, '!=', other)
-    @memoize
     def __ge__(self, other):
         return _condition_op(self, '>=', other)
-    @memoize
     def __le__(self, other):
         return _condition_op(self, '<=', other)
-    @memoize
     def __gt__(self, other):
         return _condition_op(self, '>',  other)
-    @memoize
     def __lt__(self, other):
         return _condition_op(self, '<',  other)
     
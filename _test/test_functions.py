@@ -0,0 +1,96 @@
+"""
+BSD 3-Clause License:
+Copyright (c)  2023, Eric Vignola
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+
+1. Redistributions of source code must retain the above copyright notice,
+    this list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+3. Neither the name of copyright holders nor the names of its
+    contributors may be used to endorse or promote products derived from
+    this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import unittest
+
+try:
+    import maya.standalone
+    import maya.cmds as mc
+    import maya.api.OpenMaya as om
+    maya.standalone.initialize()
+
+except:
+    pass
+
+
+from ..functions import sqrt, pow
+from .._language import Node, List
+
+
+
+class TestFunctions(unittest.TestCase):
+
+    def setUp(self):
+        pass
+
+
+    def testBatched(self):
+
+        # --- scalar lanes share multiplyDivide nodes --- #
+        mc.file(new=True, f=True)
+        obj1 = Node(mc.polyCube()[0])
+        obj2 = Node(mc.polyCube()[0])
+        obj1.t  << [4, 9, 16]
+        obj2.tx << 25
+
+        tokens = List([obj1.tx, obj1.ty, obj1.tz, obj2.tx])
+
+        # do it multiple times to test @memoize
+        for i in range(5):
+            result = sqrt(tokens)
+            self.assertEqual([round(mc.getAttr(str(x)), 3) for x in result], [2.0, 3.0, 4.0, 5.0])
+
+        # 4 lanes --> X, Y, Z of one node and X of another
+        self.assertEqual(len(mc.ls(type='multiplyDivide')), 2)
+
+
+        # --- same packing with two arguments --- #
+        mc.file(new=True, f=True)
+        obj1 = Node(mc.polyCube()[0])
+        obj1.t << [2, 3, 4]
+
+        result = pow(List([obj1.tx, obj1.ty, obj1.tz]), 2)
+        self.assertEqual([round(mc.getAttr(str(x)), 3) for x in result], [4.0, 9.0, 16.0])
+        self.assertEqual(len(mc.ls(type='multiplyDivide')), 1)
+
+
+        # --- compound plugs can't be packed, one node per call --- #
+        mc.file(new=True, f=True)
+        obj1 = Node(mc.polyCube()[0])
+        obj2 = Node(mc.polyCube()[0])
+        obj1.t << [4, 9, 16]
+        obj2.t << [25, 36, 49]
+
+        result = sqrt(List([obj1.t, obj2.t]))
+        self.assertEqual([[round(y, 3) for y in mc.getAttr(str(x))[0]] for x in result],
+                         [[2.0, 3.0, 4.0], [5.0, 6.0, 7.0]])
+        self.assertEqual(len(mc.ls(type='multiplyDivide')), 2)
@@ -31,6 +31,7 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
 import unittest
+from unittest import mock
 
 try:
     import maya.standalone
@@ -42,7 +43,8 @@ except:
     pass
 
 
-from .._language import Node, List, condition, vectorize
+from .. import _language
+from .._language import Node, List, condition, vectorize, container, memoize
 from ..attributes import Float, Vector
 
 
@@ -348,6 +350,20 @@ class TestNode(unittest.TestCase):
         result = obj1.t % 9
         self.assertEqual(mc.getAttr(str(result)), [(1, 2, 3)])
 
+        # reflected modulo, the node is the modulus
+        result = [95, 105, 130] % obj1.t
+        self.assertEqual(mc.getAttr(str(result)), [(5, 5, 10)])
+
+        # reflected modulo without the native modulo node (pre 2024)
+        mc.file(new=True, f=True)
+        obj1 = Node(mc.polyCube()[0]).t << [10, 20, 30]
+
+        with mock.patch.object(_language, 'MAYA_VERSION', 2023):
+            result = [95, 105, 130] % obj1.t
+            self.assertEqual(mc.getAttr(str(result)), [(5, 5, 10)])
+
+        self.assertEqual(len(mc.ls(type='modulo')), 0)
+
 
         # --- point matrix mult --- #
         mc.file(new=True, f=True)
@@ -370,6 +386,32 @@ class TestNode(unittest.TestCase):
 
 
 
+    def testMemoizeEviction(self):
+        mc.file(new=True, f=True)
+        
+        calls = []
+        
+        @memoize
+        def build(name):
+            calls.append(name)
+            return Node(mc.createNode('transform', name=name))
+        
+        with mock.patch.object(_language, 'MEMOIZE_CACHE_SIZE', 2):
+            build('a')
+            build('b')
+            build('a') # hit, 'a' is now the most recent
+            build('c') # full, drops 'b'
+            
+            build('a')
+            build('c')
+            self.assertEqual(calls, ['a', 'b', 'c'])
+            
+            # 'b' was evicted and gets rebuilt
+            build('b')
+            self.assertEqual(calls, ['a', 'b', 'c', 'b'])
+            
+            
+            
     def testShorthand(self):
 
         # --- full transform --- #
@@ -418,6 +460,31 @@ class TestNode(unittest.TestCase):
 
 
 
+    def testContainer(self):
+        mc.file(new=True, f=True)
+        
+        with container('test1'):
+            container.createNode('transform', name='node1')
+            container.createNode('transform', name='node2')
+            container.createNode('transform', name='node3')
+            
+            # members are queued, the container is edited when they're flushed
+            self.assertFalse(mc.container('test1', q=True, nodeList=True))
+            
+            # queued nodes are tracked by uuid, renames and deletes are fine
+            mc.rename('node2', 'renamed1')
+            mc.delete('node3')
+            
+            # get_members flushes what's pending
+            self.assertEqual(sorted(container.get_members()), ['node1', 'renamed1'])
+            
+            container.createNode('transform', name='node4')
+            
+        # leaving the scope flushes the rest
+        self.assertEqual(sorted(mc.container('test1', q=True, nodeList=True)), ['node1', 'node4', 'renamed1'])
+        self.assertEqual(container.pending, {})
+        
+        
     def testList(self):
         mc.file(new=True, f=True)
         list0 = List([1,2,3,4])
@@ -425,6 +492,35 @@ class TestNode(unittest.TestCase):
         list0 + list1
 
 
+    def testListOperators(self):
+        mc.file(new=True, f=True)
+        
+        # --- numbers are computed right away --- #
+        list0 = List([1, 2, 3, 4])
+        list1 = List([5, 6, 7, 8])
+        
+        self.assertEqual((list0 + list1).values, [6, 8, 10, 12])
+        self.assertEqual((list1 - 1).values,     [4, 5, 6, 7])
+        self.assertEqual((10 - list0).values,    [9, 8, 7, 6])
+        self.assertEqual((list0 * [2]).values,   [2, 4, 6, 8])   # pads like sequences()
+        self.assertEqual((list1 % list0).values, [0, 0, 1, 0])
+        self.assertEqual((-list0).values,        [-1, -2, -3, -4])
+        self.assertEqual((list0 > 2).values,     [False, False, True, True])
+        
+        
+        # --- nodes build a network per item --- #
+        obj1 = Node(mc.polyCube()[0])
+        obj2 = Node(mc.polyCube()[0])
+        obj1.tx << 1
+        obj2.tx << 2
+        
+        result = List([obj1.tx, obj2.tx]) * 10
+        self.assertEqual([mc.getAttr(str(x)) for x in result], [10.0, 20.0])
+        
+        result = 10 - List([obj1.tx, obj2.tx])
+        self.assertEqual([mc.getAttr(str(x)) for x in result], [9.0, 8.0])
+
+
 
     def testArguments(self):
         mc.file(new=True, f=True)
@@ -457,6 +553,27 @@ class TestNode(unittest.TestCase):
         obj1 = Node(mc.polyCube()[0])   
         obj2 = Node(mc.polyCube()[0])        
         obj1.t << condition(obj2.t > [[1,2,3]], [[1,2,3]], [[1,2,3]])
+
+        
+    def testCompoundCondition(self):
+        mc.file(new=True, f=True)
+        obj1 = Node(mc.polyCube()[0])
+        obj2 = Node(mc.polyCube()[0])
+        obj2.t << [0, 5, 0]
+        
+        # one condition node per lane, all created in the comparison's container
+        test  = obj2.t > [1, 2, 3]
+        nodes = mc.ls(type='condition')
+        self.assertEqual(len(nodes), 3)
+        self.assertEqual(len(set(mc.container(q=True, findContainer=x) for x in nodes)), 1)
+        
+        # each lane picks its own input
+        obj1.t << condition(test, [10, 20, 30], [40, 50, 60])
+        self.assertEqual(mc.getAttr(str(obj1.t)), [(40.0, 20.0, 60.0)])
+        self.assertEqual(len(mc.ls(type='condition')), 6)
+        
+        obj2.t << [2, 0, 4]
+        self.assertEqual(mc.getAttr(str(obj1.t)), [(10.0, 50.0, 30.0)])
         
         
         
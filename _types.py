@@ -0,0 +1,91 @@
+"""
+BSD 3-Clause License:
+Copyright (c)  2023, Eric Vignola
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+
+1. Redistributions of source code must retain the above copyright notice,
+    this list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+    this list of conditions and the following disclaimer in the documentation
+    and/or other materials provided with the distribution.
+
+3. Neither the name of copyright holders nor the names of its
+    contributors may be used to endorse or promote products derived from
+    this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+
+# ----------------------------- TYPE PREDICATES ------------------------------ #
+# no maya or package imports here, _language, attributes and _generators
+# all import these without a cycle
+
+# argument kinds returned by _classify, List, Node and Attribute
+# classes carry their id as __CLASS_TYPE_ID__
+_OTHER     = 0
+_LIST      = 1
+_NODE      = 2
+_ATTRIBUTE = 3
+_SCALAR    = 4
+_STRING    = 5
+_SEQUENCE  = 6
+_MATRIX    = 7
+
+
+def _is_list(obj):
+    """ tests if given input is a List class """
+    return getattr(type(obj), '__CLASS_TYPE_ID__', None) == _LIST
+
+def _is_node(obj):
+    """ tests if given input is a Node class """
+    return getattr(type(obj), '__CLASS_TYPE_ID__', None) == _NODE
+    
+def _is_attribute(obj):
+    """ tests if given input is an Attribute class """
+    return getattr(type(obj), '__CLASS_TYPE_ID__', None) == _ATTRIBUTE
+
+
+
+try:
+    _STRING_TYPES = (basestring,) # python 2.7
+except NameError:
+    _STRING_TYPES = (str,) # python 3
+
+
+def _is_basestring(obj):
+    """ tests for basestring """
+    return isinstance(obj, _STRING_TYPES)
+    
+    
+def _is_sequence(obj):
+    """ tests if given input is a sequence """
+    
+    # fast path for the most common sequences
+    if isinstance(obj, (list, tuple)):
+        return True
+    
+    if _is_basestring(obj) or isinstance(obj, dict):
+        return False
+    
+    # a __len__ that raises (0-d numpy arrays) is not a sequence
+    try:
+        len(obj)
+    except Exception:
+        return False
+    
+    return True
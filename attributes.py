@@ -34,59 +34,20 @@ import maya.cmds as mc
 import numbers, re
 import maya.api.OpenMaya as om
 
-def _is_list(obj):
-    """ tests if given input is a List class """
-    try:
-        return getattr(obj.__class__, '__CLASS_TYPE__', None) == 'List'
-    except Exception:
-        return False
+from ._types import _is_basestring, _is_sequence, _is_list, _is_node, _ATTRIBUTE
 
-def _is_node(obj):
-    """ tests if given input is a Node class """
-    try:
-        return getattr(obj.__class__, '__CLASS_TYPE__', None) == 'Node'
-    except Exception:
-        return False
-    
 
 def _is_compound(obj):
     """ tests object has compound attrs """
-    try:
-        return bool(obj.__data__.compound) or obj.__data__.any
-    except:
+    if not _is_node(obj):
         return False
-
-
-def _is_basestring(obj):
-    """ tests for basestring """
-    try:
-        return isinstance(obj, basestring) # python 2.7
-    except:
-        return isinstance(obj, str) # python 3
-    
     
-def _is_sequence(obj):
-    """ tests if given input is a sequence """
-    
-    if _is_basestring(obj):
-        return False
-    
-    try:
-        len(obj)
-        if isinstance(obj, dict):
-            return False
-    except Exception:
-        return False
-    
-    return True
+    return bool(obj.__data__.compound) or obj.__data__.any
 
 
 def _is_array(obj):
     """ tests object has array attrs """
-    try:
-        return obj.__data__.array
-    except:
-        return False
+    return _is_node(obj) and obj.__data__.array
     
 
 def _get_compound(obj):
@@ -99,6 +60,9 @@ def _get_compound(obj):
         return [obj]
 
 
+# matches the attribute or data type flag of an addAttr command
+_ADD_ATTR_RE = re.compile(r'-(at|dt)\s+"([^"]*)"')
+
 def _get_attr_type(node_attr):
     '''
     Return a node's attribute type by parsing its "addAttr" command
@@ -112,13 +76,9 @@ def _get_attr_type(node_attr):
     if attr.hasFn(om.MFn.kAttribute):
         
         # look for at or dt flags
-        attr_fn = om.MFnAttribute(attr)
-        kargs = attr_fn.getAddAttrCmd(longFlags=False).split()        
-        if '-at' in kargs:
-            return re.findall('"([^"]*)"', kargs[kargs.index('-at')+1])[0]
-            
-        elif '-dt' in kargs:
-            return re.findall('"([^"]*)"', kargs[kargs.index('-dt')+1])[0]
+        match = _ADD_ATTR_RE.search(om.MFnAttribute(attr).getAddAttrCmd(longFlags=False))
+        if match:
+            return match.group(2)
 
 
 
@@ -129,7 +89,8 @@ def _get_attr_type(node_attr):
 
 class _Attribute(object):
     
-    __CLASS_TYPE__ = 'Attribute'
+    __CLASS_TYPE__    = 'Attribute'
+    __CLASS_TYPE_ID__ = _ATTRIBUTE
     
     
     def __init__(self, name=None, **kargs):
@@ -548,7 +509,8 @@ def _clone_attribute(src_node_attr,
         # sequence is assumed to be all same type
         if not _is_sequence(src_node_attr):
             obj = str(src_node_attr)
-            node, attr = obj.split('.')[0], ('.'.join(obj.split('.')[1:])).split('[')[0]  
+            node, _, attr = obj.partition('.')
+            attr = attr.partition('[')[0]
             compound   = _is_compound(src_node_attr)
             
             if compound:
@@ -562,7 +524,8 @@ def _clone_attribute(src_node_attr,
             # find the first node in the sequence and use it
             # to establish the attribute type
             obj = next(obj for obj in src_node_attr if _is_node(obj))
-            node, attr = obj.split('.')[0], ('.'.join(obj.split('.')[1:])).split('[')[0]  
+            node, _, attr = obj.partition('.')
+            attr = attr.partition('[')[0]
             compound   = _is_compound(src_node_attr[0])
             
             if compound:
@@ -599,7 +562,7 @@ def _clone_attribute(src_node_attr,
         else:
             # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
             if obj.endswith(']'):
-                obj = '['.join(obj.split('[')[:-1]) + '[0]'
+                obj = obj.rpartition('[')[0] + '[0]'
     
             attr_type = _get_attr_type(obj)
     
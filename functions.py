@@ -41,7 +41,7 @@ import maya.cmds as mc
 import numbers
 import math
 
-from ._language import container, memoize, condition, List, Node, vectorize
+from ._language import container, memoize, condition, List, Node, vectorize, batched
 from ._language import _is_sequence, _is_node, _is_compound, _is_matrix, _get_compound
 from ._language import _plus_minus_average, _multiply_divide,  _constant
 from ._generators import sequences
@@ -60,6 +60,21 @@ def _sequence_to_node(obj):
     return obj
 
 
+def _scalar_lane(input1, input2, operation):
+    """
+    returns a multiplyDivide lane for batched functions,
+    or None if the inputs are numbers or compound plugs.
+    """
+    tokens = [input1, input2]
+    if builtins.all([isinstance(x, numbers.Real) for x in tokens]):
+        return None
+
+    if builtins.any([_is_compound(x) or _is_sequence(x) for x in tokens]):
+        return None
+
+    return (input1, input2, operation)
+
+
 
 # TODO: should this be memoized?
 @memoize
@@ -565,6 +580,7 @@ def min(tokens):
 
 
 @vectorize
+@batched(lambda token: _scalar_lane(math.e, token, 3))
 @memoize
 def exp(token):
     """ 
@@ -607,6 +623,7 @@ def sign(token):
 
 
 @vectorize
+@batched(lambda token: _scalar_lane(token, 0.5, 3))
 @memoize
 def sqrt(token):
     """ 
@@ -628,6 +645,7 @@ def sqrt(token):
 
 
 @vectorize
+@batched(lambda base, exponent: _scalar_lane(base, exponent, 3))
 @memoize
 def pow(base, exponent):
     """ 